@@ -1,33 +1,12 @@
-import logging
 import os
+from functools import cached_property
 from dotenv import load_dotenv
 from app.models.singleton import SingletonMeta  # Adjust the import path as necessary
 
 class Config(metaclass=SingletonMeta):
-    _is_initialized = False
-
     def __init__(self):
+        # SingletonMeta only runs __init__ for the first Config() call
         load_dotenv()  # Load environment variables from .env file
-        if not self._is_initialized:
-            self.logger = logging.getLogger(__name__)
-            
-            # Store the configuration values in private variables
-            self._mqtt_broker = self.get('MQTT_BROKER', 'localhost')
-            self._mqtt_port = int(self.get('MQTT_PORT', 1883))
-            self._mqtt_topic = self.get('MQTT_TOPIC', 'iot/devices')
-
-            # SSL key and cert with development defaults
-            self._ssl_keyfile = self.get('SSL_KEYFILE', 'ssl/private/insecure.key')
-            self._ssl_certfile = self.get('SSL_CERTFILE', 'ssl/certs/insecure.pem')
-
-            # Host and Port for FastAPI/Uvicorn
-            self._host = self.get('HOST', '127.0.0.1')  # Default local host
-            self._port = int(self.get('PORT', 8084))  # Default to 8084
-            
-            # Plugins directory path from .env
-            self._plugins_dir = self.get('PLUGINS_DIR', 'app/plugins')            
-
-            self._is_initialized = True
 
     @classmethod
     def initialize(cls):
@@ -38,42 +17,40 @@ class Config(metaclass=SingletonMeta):
     def get(key, default=None):
         return os.getenv(key, default)
 
-    # Property for MQTT_BROKER
-    @property
+    # Configuration values are read from the environment on first access and
+    # cached on the instance, so unused settings are never looked up
+
+    @cached_property
     def MQTT_BROKER(self):
-        return self._mqtt_broker
+        return self.get('MQTT_BROKER', 'localhost')
 
-    # Property for MQTT_PORT
-    @property
+    @cached_property
     def MQTT_PORT(self):
-        return self._mqtt_port
+        return int(self.get('MQTT_PORT', 1883))
 
-    # Property for MQTT_TOPIC
-    @property
+    @cached_property
     def MQTT_TOPIC(self):
-        return self._mqtt_topic
+        return self.get('MQTT_TOPIC', 'iot/devices')
 
-    # Property for SSL_KEYFILE
-    @property
+    # SSL key and cert with development defaults
+    @cached_property
     def SSL_KEYFILE(self):
-        return self._ssl_keyfile
+        return self.get('SSL_KEYFILE', 'ssl/private/insecure.key')
 
-    # Property for SSL_CERTFILE
-    @property
+    @cached_property
     def SSL_CERTFILE(self):
-        return self._ssl_certfile
+        return self.get('SSL_CERTFILE', 'ssl/certs/insecure.pem')
 
-    # Property for HOST
-    @property
+    # Host and Port for FastAPI/Uvicorn
+    @cached_property
     def HOST(self):
-        return self._host
+        return self.get('HOST', '127.0.0.1')  # Default local host
 
-    # Property for PORT
-    @property
+    @cached_property
     def PORT(self):
-        return self._port
+        return int(self.get('PORT', 8084))  # Default to 8084
 
-    # Property for PLUGINS_DIR
-    @property
+    # Plugins directory path from .env
+    @cached_property
     def PLUGINS_DIR(self):
-        return self._plugins_dir
\ No newline at end of file
+        return self.get('PLUGINS_DIR', 'app/plugins')
@@ -1,13 +1,86 @@
 import asyncio
 import base64
-import json
+import functools
 import logging
 import os
+import orjson
+import signal
 import uvicorn
-from fastapi import FastAPI, Header, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 from app.config import Config
 from app.models import CommandLineArgs
-from app.services.mqtt_service import MqttService 
+from app.services.mqtt_service import MqttService
+
+logger = logging.getLogger(__name__)
+
+# File with one valid API key per line
+API_KEYS_FILE = "app/resources/api_keys.txt"
+
+router = APIRouter()
+
+
+def get_mqtt_service(request: Request) -> MqttService:
+    """
+    FastAPI dependency returning the MqttService attached to the application.
+    """
+    return request.app.state.mqtt_service
+
+
+@router.get("/")
+async def read_root():
+    return {"message": "Welcome to the Host API!"}
+
+
+@router.get("/mqtt/status")
+async def mqtt_status(mqtt_service: MqttService = Depends(get_mqtt_service)):
+    # Use MqttService to check the connection status
+    status = "connected" if mqtt_service.client.is_connected() else "disconnected"
+    return {"status": status}
+
+
+@router.post("/topics/{url_encoded_topic_name:path}")
+async def mqtt_topics_publish(
+    url_encoded_topic_name: str,
+    request: Request,
+    qos: int = Query(0, description="The Quality of Service level"),
+    retain: bool = Query(
+        False, description="Set the RETAIN flag when the message is published"
+    ),
+    x_amz_mqtt5_user_properties: str = Header(None),
+    mqtt_service: MqttService = Depends(get_mqtt_service),
+):
+    # Check if the header exists and looks like base64 before decoding it
+    if not x_amz_mqtt5_user_properties or not x_amz_mqtt5_user_properties.isascii():
+        raise HTTPException(status_code=401, detail="Not authorized")
+
+    # Decode the base64 encoded header value for user properties
+    decoded_properties = Host.decode_user_properties(x_amz_mqtt5_user_properties)
+    if not isinstance(decoded_properties, list):
+        raise HTTPException(status_code=401, detail="Not authorized")
+
+    # Flatten the user properties once so every key is a single dict lookup
+    properties = Host.flatten_user_properties(decoded_properties)
+
+    # Check if the API_KEY is present and valid
+    api_key = properties.get("API_KEY")
+    if not api_key or api_key not in Host.load_api_keys():
+        raise HTTPException(status_code=401, detail="Not authorized")
+
+    # The topic is captured by the {url_encoded_topic_name:path} converter
+    topic = url_encoded_topic_name
+
+    # Extract the raw body of the request
+    body = await request.body()
+    message = body.decode("utf-8")  # Decode bytes to string
+
+    # Use MqttService to publish the message to the MQTT topic; the raw body avoids re-encoding
+    await mqtt_service.publish(topic, body)
+
+    return {
+        "message": f"Message '{message}' published to topic '{topic}' with QoS {qos}."
+    }
+
 
 class Host:
     def __init__(self, args: CommandLineArgs):
@@ -19,75 +92,29 @@ class Host:
         """
         self.args = args
         self.config = Config()
-        self.logger = logging.getLogger(__name__)
 
-        # Access the configuration via properties
+        # Capture the configuration values used by the server
         self.host = self.config.HOST
         self.port = self.config.PORT
+        self.ssl_keyfile = self.config.SSL_KEYFILE
+        self.ssl_certfile = self.config.SSL_CERTFILE
+
+        # Initialize MqttService (Singleton)
+        self.mqtt_service = MqttService(client_id="mqtt_service_host")
 
         # Initialize FastAPI
-        self.app = FastAPI()
+        self.app = FastAPI(default_response_class=ORJSONResponse)
         self.setup_routes()
 
-        # Initialize MqttService (Singleton)
-        self.mqtt_service = MqttService(client_id="mqtt_service_host")
+        # Set to stop run_async
+        self._shutdown_event = asyncio.Event()
 
     def setup_routes(self):
         """
-        Setup FastAPI routes.
-        """
-        @self.app.get("/")
-        async def read_root():
-            return {"message": "Welcome to the Host API!"}
-
-        @self.app.get("/mqtt/status")
-        async def mqtt_status():
-            # Use MqttService to check the connection status
-            status = "connected" if self.mqtt_service.client.is_connected() else "disconnected"
-            return {"status": status}
-
-        @self.app.post("/topics/{url_encoded_topic_name:path}")
-        async def mqtt_topics_publish(
-            request: Request,
-            qos: int = Query(0, description="The Quality of Service level"),
-            retain: bool = Query(
-                False, description="Set the RETAIN flag when the message is published"
-            ),
-            x_amz_mqtt5_user_properties: str = Header(None),
-        ):
-            # Check if the header exists
-            if not x_amz_mqtt5_user_properties:
-                raise HTTPException(status_code=401, detail="Not authorized")
-
-            # Extract the full path from the request
-            full_path = request.url.path
-            topic = full_path.split("/topics/", 1)[-1]
-
-            # Extract the raw body of the request
-            body = await request.body()
-            message = body.decode("utf-8")  # Decode bytes to string
-
-            # Decode the base64 encoded header value for user properties
-            decoded_properties = self.decode_user_properties(x_amz_mqtt5_user_properties)
-
-            # Check if the API_KEY is present and valid
-            api_key = next(
-                (
-                    prop.get("API_KEY")
-                    for prop in decoded_properties
-                    if "API_KEY" in prop
-                ),
-                None,
-            )
-            if not api_key or api_key not in self.load_api_keys():
-                raise HTTPException(status_code=401, detail="Not authorized")
-
-            # Use MqttService to publish the message to the MQTT topic
-            await self.mqtt_service.publish(topic, message)
-
-            return {
-                "message": f"Message '{message}' published to topic '{topic}' with QoS {qos}."
-            }
+        Setup FastAPI routes and expose the MqttService to the route dependencies.
+        """
+        self.app.state.mqtt_service = self.mqtt_service
+        self.app.include_router(router)
 
     @staticmethod
     def decode_user_properties(encoded_user_properties):
@@ -96,45 +123,95 @@ class Host:
         """
         try:
             decoded_bytes = base64.b64decode(encoded_user_properties)
-            decoded_string = decoded_bytes.decode("utf-8")
-
-            if decoded_string.startswith('"') and decoded_string.endswith('"'):
-                decoded_string = json.loads(decoded_string)
 
-            user_properties_json = json.loads(decoded_string)
+            # orjson parses bytes directly; only a JSON-encoded string
+            # (wrapped in quotes) needs a second parse
+            user_properties_json = orjson.loads(decoded_bytes)
+            if isinstance(user_properties_json, str):
+                user_properties_json = orjson.loads(user_properties_json)
 
             return user_properties_json
-        except (base64.binascii.Error, json.JSONDecodeError) as e:
-            logging.error(f"Error decoding user properties: {e}")
+        except (base64.binascii.Error, orjson.JSONDecodeError) as e:
+            logger.error(f"Error decoding user properties: {e}")
             return None
 
     @staticmethod
-    def load_api_keys(file_path="app/resources/api_keys.txt"):
+    def flatten_user_properties(user_properties):
+        """
+        Merge a list of user property objects into a single dictionary.
+
+        Parameters:
+        user_properties (list): Decoded user properties, e.g. [{"API_KEY": "..."}, ...].
+
+        Returns:
+        dict: All properties keyed by name; the first occurrence of a key wins.
+        """
+        properties = {}
+        for prop in reversed(user_properties):
+            if isinstance(prop, dict):
+                properties.update(prop)
+        return properties
+
+    @staticmethod
+    def load_api_keys(file_path=API_KEYS_FILE):
         """
         Loads the valid API keys from a file.
 
+        The parsed keys are cached and the file is only re-read when its
+        modification time changes.
+
         Parameters:
         file_path (str): Path to the API keys file.
 
         Returns:
-        set: A set of valid API keys.
+        frozenset: A set of valid API keys.
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                keys = {line.strip() for line in file if line.strip()}
-            return keys
+            mtime = os.path.getmtime(file_path)
+            return Host._read_api_keys(file_path, mtime)
         except Exception as e:
-            logging.error(f"Error loading API keys from file: {e}")
-            return set()
+            # Failures are not cached, so the next request retries the file
+            logger.error("Error loading API keys from file: %s", e)
+            return frozenset()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _read_api_keys(file_path, mtime):
+        """
+        Read and parse the API keys file. Cached on (file_path, mtime); errors propagate
+        to load_api_keys uncached.
+        """
+        with open(file_path, "r", encoding="utf-8") as file:
+            return frozenset(line.strip() for line in file if line.strip())
+
+    def request_shutdown(self):
+        """
+        Request a graceful shutdown of the running process.
+        """
+        self._shutdown_event.set()
+
+    def install_signal_handlers(self):
+        """
+        Trigger a graceful shutdown on SIGINT/SIGTERM.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.request_shutdown)
+            except (NotImplementedError, RuntimeError):
+                # Signal handlers are not supported on this platform/thread
+                pass
 
     async def run_async(self):
         """
         Asynchronous method to start both MQTT and FastAPI server concurrently.
         """
-        self.logger.info("Starting host process.")
+        logger.info("Starting host process.")
         fastapi_task = None  # Initialize fastapi_task to None
 
         try:
+            self.install_signal_handlers()
+
             # Start MQTT connection asynchronously
             #self.mqtt_service.connect()
             await self.mqtt_service.async_connect()
@@ -142,22 +219,27 @@ class Host:
             # Wait for MQTT connection asynchronously
             await self.mqtt_service.wait_for_connection()
 
-            # Start the heartbeat task
-            heartbeat_task = asyncio.create_task(self.mqtt_service.heartbeat())
+            # Start the heartbeat
+            self.mqtt_service.start_heartbeat()
 
             # Start FastAPI server as a task
             fastapi_task = asyncio.create_task(self.start_fastapi())
+            # Stop the host as well if the server exits on its own
+            fastapi_task.add_done_callback(lambda _: self.request_shutdown())
 
-            # Keep the process running until interrupted
-            while True:
-                await asyncio.sleep(1)
+            # Keep the process running until a shutdown is requested
+            await self._shutdown_event.wait()
+            logger.info("Stopping host process.")
 
         except asyncio.CancelledError:
-            self.logger.info("Stopping host process.")
+            logger.info("Stopping host process.")
         finally:
             if fastapi_task:  # Check if fastapi_task is initialized
                 fastapi_task.cancel()
-                await fastapi_task
+                try:
+                    await fastapi_task
+                except asyncio.CancelledError:
+                    pass
             await self.mqtt_service.shutdown()
 
     async def start_fastapi(self):
@@ -169,8 +251,9 @@ class Host:
             host=self.host,
             port=self.port,
             log_level="info",
-            ssl_keyfile=self.config.SSL_KEYFILE,
-            ssl_certfile=self.config.SSL_CERTFILE,
+            http="httptools",
+            ssl_keyfile=self.ssl_keyfile,
+            ssl_certfile=self.ssl_certfile,
         )
         server = uvicorn.Server(config)
         await server.serve()
@@ -183,7 +266,6 @@ class Host:
 
 
 async def main_async():
-    logger = logging.getLogger(__name__)
     try:
         # Create an instance of Host with parsed arguments
         args = CommandLineArgs()  # Ensure CommandLineArgs is properly initialized
@@ -1,12 +1,16 @@
 import asyncio
 import logging
+import signal
 import importlib
-import inspect
 import os
 from app.plugins.plugin_interface import IotPlugin
 from app.config import Config
 from app.models import CommandLineArgs
 from app.services.mqtt_service import MqttService
+from app.utils import MessageInbox, TopicTrie
+
+logger = logging.getLogger(__name__)
+
 
 class IotHandler:
     """
@@ -14,6 +18,29 @@ class IotHandler:
     messages related to various IoT devices such as TVs, lights, thermostats, etc.
     """
 
+    __slots__ = (
+        "args",
+        "config",
+        "mqtt_service",
+        "plugin_dir",
+        "plugins",
+        "_topic_trie",
+        "_topic_routes",
+        "_message_queue",
+        "_shutdown_event",
+    )
+
+    # Upper bound on the number of topics kept in the routing cache
+    MAX_CACHED_TOPICS = 1024
+    # Upper bound on the number of messages waiting for the consumer task
+    MAX_QUEUED_MESSAGES = 10000
+    # Maximum number of queued messages dispatched to the plugins in one batch
+    MAX_BATCH_SIZE = 100
+    # Maximum number of batches dispatched to the plugins at the same time
+    MAX_CONCURRENT_BATCHES = 8
+    # Log a warning for the first dropped message and then once per this many drops
+    DROP_LOG_INTERVAL = 100
+
     def __init__(self, args: CommandLineArgs):
         """
         Initializes the IotHandler class with command line arguments and an MQTT service.
@@ -23,18 +50,52 @@ class IotHandler:
         
         Attributes:
         - self.mqtt_service: Instance of the MqttService class for handling MQTT connections.
-        - self.iot_topics: List of MQTT topics related to various IoT devices.
+        - self.plugins: The loaded plugins, whose topics are subscribed and routed to them.
         """
         self.args = args
         self.config = Config()
-        self.logger = logging.getLogger(__name__)
 
         # Initialize MqttService for the IoT handler
         self.mqtt_service = MqttService(client_id="mqtt_service_iot_handler")
         self.plugin_dir = self.config.PLUGINS_DIR
 
-        # Store the current asyncio event loop to schedule tasks
-        self.loop = asyncio.get_event_loop()
+        self.plugins = []
+        # Topic filters of the subscribed plugins, built in subscribe_plugin_topics
+        self._topic_trie = TopicTrie()
+        # Cache of topic -> plugins that can handle it, filled on first use
+        self._topic_routes = {}
+
+        # Messages queued by on_message_sync for the consumer task (see consume_messages)
+        self._message_queue = MessageInbox(
+            self.MAX_QUEUED_MESSAGES,
+            self.MAX_BATCH_SIZE,
+            self.DROP_LOG_INTERVAL,
+            self.MAX_CONCURRENT_BATCHES,
+        )
+
+        # Set to stop run_async
+        self._shutdown_event = asyncio.Event()
+
+    @staticmethod
+    def find_plugin_classes(module):
+        """
+        Return the (name, class) pairs of IotPlugin implementations defined in a module.
+
+        The module namespace is scanned directly instead of through `inspect.getmembers`,
+        and classes merely imported into the module are skipped so that a plugin is only
+        instantiated from the module that defines it.
+
+        Parameters:
+        - module: The imported plugin module.
+        """
+        return [
+            (name, obj)
+            for name, obj in vars(module).items()
+            if isinstance(obj, type)
+            and issubclass(obj, IotPlugin)
+            and obj is not IotPlugin
+            and obj.__module__ == module.__name__
+        ]
 
     async def load_plugins(self):
         """
@@ -44,6 +105,8 @@ class IotHandler:
         plugins = []
 
         for root, dirs, files in os.walk(self.plugin_dir):  # Traverse the plugin directory recursively
+            # Skip __pycache__ and hidden directories, which never contain plugin modules
+            dirs[:] = [d for d in dirs if not d.startswith(("__", "."))]
             for file_name in files:
                 if file_name.endswith('.py') and not file_name.startswith('__'):
                     # Construct the module path by converting file path to a module path format
@@ -52,76 +115,172 @@ class IotHandler:
                     
                     try:
                         module = importlib.import_module(module_path)
-                        # Find all classes in the module that implement the IotPlugin interface
-                        for name, obj in inspect.getmembers(module, inspect.isclass):
-                            if issubclass(obj, IotPlugin) and obj is not IotPlugin:
-                                plugin_instance = obj()  # Instantiate plugin
-                                self.logger.debug(f"Loaded plugin: {name}")
-                                await plugin_instance.initialize()  # Call initialize on the plugin
-                                plugins.append(plugin_instance)
+                        # Find all classes defined in the module that implement the IotPlugin interface
+                        for name, obj in self.find_plugin_classes(module):
+                            plugin_instance = obj()  # Instantiate plugin
+                            logger.debug(f"Loaded plugin: {name}")
+                            await plugin_instance.initialize()  # Call initialize on the plugin
+                            plugins.append(plugin_instance)
                     except Exception as e:
-                        self.logger.error(f"Error loading plugin from {module_path}: {e}")
+                        logger.error(f"Error loading plugin from {module_path}: {e}")
 
 
         return plugins
 
+    def get_plugins_for_topic(self, topic: str) -> tuple:
+        """
+        Return the plugins that can handle the given topic.
+
+        Candidates are the plugins whose subscribed topic filters match the topic
+        (looked up in the topic trie); each candidate still confirms the topic via
+        `can_handle_topic`. The result is cached per topic, so the plugins are only
+        asked once for each distinct topic.
+
+        Parameters:
+        - topic (str): The MQTT topic of the incoming message.
+        """
+        plugins = self._topic_routes.get(topic)
+        if plugins is None:
+            candidates = set(self._topic_trie.match(topic))
+            plugins = tuple(
+                plugin for plugin in self.plugins
+                if plugin in candidates and plugin.can_handle_topic(topic)
+            )
+            if len(self._topic_routes) >= self.MAX_CACHED_TOPICS:
+                self._topic_routes.clear()
+            self._topic_routes[topic] = plugins
+        return plugins
+
     def subscribe_plugin_topics(self):
         """
         Subscribe the MQTT client to all topics handled by the loaded plugins.
         """
+        # Index the topics of all plugins for routing and send them in a single SUBSCRIBE
+        self._topic_trie.clear()
+        self._topic_routes.clear()
+        topics = {}
         for plugin in self.plugins:
             for topic in plugin.get_topics():
-                self.mqtt_service.client.subscribe(topic)
-                self.logger.info("Subscribed to topic: %s", topic)
-                
+                self._topic_trie.insert(topic, plugin)
+                topics[topic] = None
+
+        if not topics:
+            logger.warning("No plugin topics to subscribe to.")
+            return
+
+        self.mqtt_service.client.subscribe([(topic, 0) for topic in topics])
+        logger.info("Subscribed to %d topics: %s", len(topics), ", ".join(topics))
+
     def on_message_sync(self, client, userdata, message):
         """
-        Synchronous message handler for MQTT messages. When a message is received,
-        it schedules the async handler on the event loop.
+        Synchronous message handler for MQTT messages. The MQTT client's socket is read
+        from the event loop, so this runs on the loop thread and queues the message for
+        the message consumer directly.
 
         Parameters:
         - client: The MQTT client instance.
         - userdata: User data provided at the time of subscription.
         - message: The message received on the subscribed topic.
         """
-        # Use asyncio.run_coroutine_threadsafe to run the async handler on the event loop
-        asyncio.run_coroutine_threadsafe(self.on_message_async(client, userdata, message), self.loop)
+        self._message_queue.put_nowait(message)
+
+    async def consume_messages(self):
+        """
+        Long-running task that dispatches the queued MQTT messages to the plugins in batches.
 
-    async def on_message_async(self, client, userdata, message):
+        A burst of messages is handed to each plugin in a single call, while an isolated
+        message is still processed without delay. Each batch is dispatched in its own
+        task, up to MAX_CONCURRENT_BATCHES at once, so a slow device does not hold up
+        the messages behind it (see MessageInbox.consume).
         """
-        Asynchronous handler for processing MQTT messages received on subscribed topics.
-        Handles specific messages for various IoT devices.
+        await self._message_queue.consume(self.dispatch_messages)
+
+    def _prepare_message(self, message):
+        """
+        Resolve the plugins for a message.
 
         Parameters:
-        - client: The MQTT client instance.
-        - userdata: User data provided at the time of subscription.
         - message: The message received on the subscribed topic.
+
+        Returns:
+        - tuple: (topic, payload, plugins), or None if no plugin handles the topic.
         """
         topic = message.topic
-        payload = message.payload.decode("utf-8")  # Decode message payload to a string
 
-        self.logger.info("Received message on topic %s: %s", topic, payload)
+        plugins = self.get_plugins_for_topic(topic)
+        if not plugins:
+            logger.warning("No plugin found to handle topic: %s", topic)
+            return None
+
+        # The raw payload bytes are passed on as-is; plugins parse them directly
+        payload = message.payload
+        logger.info("Received message on topic %s: %d bytes", topic, len(payload))
+        return topic, payload, plugins
+
+    async def dispatch_messages(self, messages: list):
+        """
+        Deliver a batch of MQTT messages to the plugins that handle them.
+
+        Messages are grouped per plugin, preserving their arrival order, and each plugin
+        receives its group through `process_messages`. The plugins run concurrently.
+
+        Parameters:
+        - messages (list): The messages received on the subscribed topics.
+        """
+        batches = {}
+        for message in messages:
+            prepared = self._prepare_message(message)
+            if prepared is None:
+                continue
+            topic, payload, plugins = prepared
+            for plugin in plugins:
+                batches.setdefault(plugin, []).append((topic, payload))
+
+        if not batches:
+            return
+
+        # Skip the per-plugin loop entirely when INFO is disabled
+        if logger.isEnabledFor(logging.INFO):
+            for plugin, items in batches.items():
+                logger.info("Delegating %d message(s) to plugin %s", len(items), plugin.__class__.__name__)
+
+        results = await asyncio.gather(
+            *(plugin.process_messages(items) for plugin, items in batches.items()),
+            return_exceptions=True,
+        )
+        for plugin, result in zip(batches, results):
+            if isinstance(result, Exception):
+                logger.error("Plugin %s failed to process messages: %s", plugin.__class__.__name__, result)
+
+    def request_shutdown(self):
+        """
+        Request a graceful shutdown of the running process.
+        """
+        self._shutdown_event.set()
+
+    def install_signal_handlers(self):
+        """
+        Trigger a graceful shutdown on SIGINT/SIGTERM.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.request_shutdown)
+            except (NotImplementedError, RuntimeError):
+                # Signal handlers are not supported on this platform/thread
+                pass
 
-        # Loop through each plugin and find all that can handle this topic
-        handled = False
-        for plugin in self.plugins:
-            if plugin.can_handle_topic(topic):
-                self.logger.info(f"Delegating message on topic {topic} to plugin {plugin.__class__.__name__}")
-                await plugin.process_message(topic, payload)
-                handled = True
-
-        if not handled:
-            self.logger.warning(f"No plugin found to handle topic: {topic}")
-            
-    
     async def run_async(self):
         """
         Asynchronous method to start and manage the MQTT service. It connects to the broker,
         maintains the connection with a heartbeat, and runs indefinitely until interrupted.
         """
-        self.logger.info("Starting IOT Handler process.")
+        logger.info("Starting IOT Handler process.")
+        consumer_task = None
 
         try:
+            self.install_signal_handlers()
+
             # Asynchronously connect to the MQTT broker
             await self.mqtt_service.async_connect()
 
@@ -132,22 +291,31 @@ class IotHandler:
             self.plugins = await self.load_plugins()  # Ensure plugins are loaded and initialized
             self.subscribe_plugin_topics()  # Subscribe the loaded plugins' topics
 
-            # Start the heartbeat task to maintain the MQTT connection
-            heartbeat_task = asyncio.create_task(self.mqtt_service.heartbeat())
+            # Start the heartbeat to maintain the MQTT connection
+            self.mqtt_service.start_heartbeat()
 
-            # Set the synchronous message handler for MQTT messages
+            # Start the consumer and set the synchronous message handler for MQTT messages
+            consumer_task = asyncio.create_task(self.consume_messages())
             self.mqtt_service.client.on_message = self.on_message_sync
         
-            # Keep the process running until interrupted
-            while True:
-                await asyncio.sleep(1)
+            # Keep the process running until a shutdown is requested
+            await self._shutdown_event.wait()
+            logger.info("Stopping IOT Handler process.")
 
         except asyncio.CancelledError:
             # Handle process cancellation gracefully
-            self.logger.info("Stopping IOT Handler process.")
+            logger.info("Stopping IOT Handler process.")
         finally:
+            if consumer_task:
+                consumer_task.cancel()
+                try:
+                    await consumer_task
+                except asyncio.CancelledError:
+                    pass
+            # Stop the dispatches still running before the plugins shut down
+            await self._message_queue.aclose()
             for plugin in self.plugins:
-                await plugin.shutdown()            
+                await plugin.shutdown()
             # Ensure graceful disconnection from the MQTT broker
             await self.mqtt_service.shutdown()
 
@@ -162,7 +330,6 @@ async def main_async():
     """
     Asynchronous main function to initialize and run the IoT handler.
     """
-    logger = logging.getLogger(__name__)
     try:
         # Create an instance of the IoT handler with parsed arguments
         args = CommandLineArgs()  # Ensure CommandLineArgs is properly initialized
@@ -1,10 +1,15 @@
 class SingletonMeta(type):
     """
     A Singleton metaclass that creates only one instance of the singleton class.
+
+    The class is constructed (and its __init__ run) on the first call only;
+    subsequent calls return the cached instance without re-running __init__.
     """
     _instances = {}
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is None:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return instance
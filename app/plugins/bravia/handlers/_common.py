@@ -0,0 +1,27 @@
+import orjson
+
+_loads = orjson.loads
+
+
+def parse_and_validate(payload, validator, logger, *args):
+    """
+    Parse a handler payload and validate its structure and content.
+
+    :param payload: JSON bytes, string or dictionary received for the directive.
+    :param validator: Callable taking the payload dictionary (and *args) and returning a bool.
+    :param logger: Logger used to report decoding and validation errors.
+    :param args: Extra arguments passed to the validator (e.g., the command).
+    :return: The payload dictionary if it is valid, else None.
+    """
+    # Parse the JSON payload unless it was already given as a dictionary
+    try:
+        payload_dict = payload if isinstance(payload, dict) else _loads(payload)
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to decode JSON payload: %s", e)
+        return None
+
+    if not validator(payload_dict, *args):
+        logger.error("Invalid payload: %s", payload_dict)
+        return None
+
+    return payload_dict
@@ -1,14 +1,32 @@
-import json
 import logging
 
+from ..models.device_ref import DeviceRef
+from ._common import parse_and_validate
 from ..services.playback_intent_service import PlaybackIntentService
 
+logger = logging.getLogger(__name__)
+
+# Playback command -> PlaybackIntentService method name
+_DISPATCH = {
+    "play": "play",
+    "pause": "pause",
+    "stop": "stop",
+    "rewind": "rewind",
+    "fastforward": "fast_forward",
+    "startover": "start_over",
+    "previous": "previous",
+    "next": "next",
+}
+_VALID_COMMANDS = frozenset(_DISPATCH)
+
 
 class PlaybackIntentHandler:
     """
     A handler class to process playback directives for TV devices.
     """
 
+    __slots__ = ("playback_intent_service",)
+
     def __init__(self, playback_intent_service: PlaybackIntentService):
         """
         Initialize the PlaybackIntentHandler with the PlaybackIntentService.
@@ -16,24 +34,23 @@ class PlaybackIntentHandler:
         Args:
             playback_intent_service (PlaybackIntentService): The service responsible for handling playback intents.
         """
-        self.logger = logging.getLogger(__name__)
         self.playback_intent_service = playback_intent_service
 
     async def handle_playback_command(
-        self, device_type: str, device: dict, command: str, payload
+        self, device_type: str, device: DeviceRef, command: str, payload
     ):
         """
         Handle the playback command directive for a given device.
 
         Args:
             device_type (str): Type of the device (e.g., 'tv').
-            device (dict): The device configuration dictionary.
+            device (DeviceRef): The device reference, wrapping the device configuration dictionary.
             command (str): The playback command to execute (e.g., 'play', 'pause', 'stop').
-            payload (str or dict): JSON string or dictionary containing playback command information.
+            payload (bytes, str or dict): JSON bytes, string or dictionary containing playback command information.
         """
-        device_id = device.get("device_id") or device.get("object_id")
+        device_id = device.device_id
         
-        self.logger.info(
+        logger.info(
             "Handling playback command: Device Type: %s, Device ID: %s, Command: %s, Payload: %s",
             device_type,
             device_id,
@@ -41,63 +58,41 @@ class PlaybackIntentHandler:
             payload,
         )
         
-        # Ensure payload is a dictionary by parsing JSON if it's a string
-        if isinstance(payload, str):
-            try:
-                payload_dict = json.loads(payload)
-            except json.JSONDecodeError as e:
-                self.logger.error("Failed to decode JSON payload: %s", e)
-                return
-        else:
-            payload_dict = payload
-
-        # Validate the payload structure and content
-        if not await self.validate_payload(payload_dict, command):
-            self.logger.error("Invalid payload: %s", payload_dict)
+        # Parse the payload and validate its structure and content
+        payload_dict = parse_and_validate(payload, self.validate_payload, logger, command)
+        if payload_dict is None:
             return
 
         # Handle playback commands
         try:
             success = False
-            if command == "play":
-                success = await self.playback_intent_service.play(device)
-            elif command == "pause":
-                success = await self.playback_intent_service.pause(device)
-            elif command == "stop":
-                success = await self.playback_intent_service.stop(device)
-            elif command == "rewind":
-                success = await self.playback_intent_service.rewind(device)
-            elif command == "fastforward":
-                success = await self.playback_intent_service.fast_forward(device)
-            elif command == "startover":
-                success = await self.playback_intent_service.start_over(device)
-            elif command == "previous":
-                success = await self.playback_intent_service.previous(device)
-            elif command == "next":
-                success = await self.playback_intent_service.next(device)
+            method_name = _DISPATCH.get(command)
+            method = getattr(self.playback_intent_service, method_name) if method_name else None
+            if method:
+                success = await method(device.raw)
             else:
-                self.logger.error("Invalid playback command: %s", command)
+                logger.error("Invalid playback command: %s", command)
 
             if success:
-                self.logger.info(
+                logger.info(
                     "Successfully executed playback command '%s' for device %s.",
                     command,
                     device_id,
                 )
             else:
-                self.logger.error(
+                logger.error(
                     "Failed to execute playback command for device %s.", device_id
                 )
 
         except Exception as e:
-            self.logger.error(
+            logger.error(
                 "Exception while executing playback command '%s' for device %s: %s",
                 command,
                 device_id,
                 e,
             )
 
-    async def validate_payload(self, payload: dict, command: str) -> bool:
+    def validate_payload(self, payload: dict, command: str) -> bool:
         """
         Validate the structure and content of the payload based on the command.
 
@@ -110,17 +105,8 @@ class PlaybackIntentHandler:
         """
         # In this scenario, most playback commands may not require specific payload validation.
         # However, if additional parameters are needed, implement the checks here.
-        if command not in [
-            "play",
-            "pause",
-            "stop",
-            "rewind",
-            "fastforward",
-            "startover",
-            "previous",
-            "next",
-        ]:
-            self.logger.error("Invalid playback command: %s", command)
+        if command not in _VALID_COMMANDS:
+            logger.error("Invalid playback command: %s", command)
             return False
 
         # Additional validation logic can be added here if needed
@@ -1,73 +1,67 @@
-import json
 import logging
+from ..models.device_ref import DeviceRef
+from ._common import parse_and_validate
 from ..services.power_intent_service import PowerIntentService
 
+logger = logging.getLogger(__name__)
+
 
 class PowerIntentHandler:
     """
     A handler class to process power set directives for devices.
     """
 
+    __slots__ = ("power_intent_service",)
+
     POWER_ON = "ON"
     POWER_OFF = "OFF"
     POWER_INTENT = "PowerIntent"
 
+    # Normalized powerState value -> whether the device should be powered on
+    POWER_STATES = {POWER_ON: True, POWER_OFF: False}
+
     def __init__(self, power_intent_service: PowerIntentService):
         """Initialize the PowerIntentHandler with the PowerIntentService."""
-        self.logger = logging.getLogger(__name__)
         self.power_intent_service = power_intent_service
 
-    async def handle_power_set(self, device_type: str, device: dict, payload):
+    async def handle_power_set(self, device_type: str, device: DeviceRef, payload):
         """
         Handle the power set directive for a given device.
 
         :param device_type: Type of the device (e.g., 'tv').
-        :param device: Dictionary containing the device's configuration, including device_id and other attributes.
-        :param payload: JSON string or dictionary containing power state information.
+        :param device: The device reference, wrapping the device's configuration (device_id and other attributes).
+        :param payload: JSON bytes, string or dictionary containing power state information.
         """
-        device_id = device.get("device_id")
-        self.logger.info(
+        device_id = device.device_id
+        logger.info(
             "Handling power set directive: Device Type: %s, Device ID: %s, Payload: %s",
             device_type,
             device_id,
             payload,
         )
 
-        # Ensure payload is a dictionary by parsing JSON if it's a string
-        if isinstance(payload, str):
-            try:
-                payload_dict = json.loads(payload)
-            except json.JSONDecodeError as e:
-                self.logger.error("Failed to decode JSON payload: %s", e)
-                return
-        else:
-            payload_dict = payload
-
-        # Validate the payload structure and content
-        if not self.validate_payload(payload_dict):
-            self.logger.error("Invalid payload: %s", payload_dict)
+        # Parse the payload and validate its structure and content
+        payload_dict = parse_and_validate(payload, self.validate_payload, logger)
+        if payload_dict is None:
             return
 
         # Extract power state from the validated payload
-        power_state = payload_dict["powerState"].strip().upper()
+        power_on = self.parse_power_state(payload_dict["powerState"])
 
         # Pass the device structure to the PowerIntentService to handle the action
-        success = False
-        if power_state == self.POWER_ON:
-            success = await self.power_intent_service.handle_power_on_intent(device)
-        elif power_state == self.POWER_OFF:
-            success = await self.power_intent_service.handle_power_off_intent(device)
+        if power_on:
+            success = await self.power_intent_service.handle_power_on_intent(device.raw)
         else:
-            self.logger.error("Invalid power state received: %s", power_state)
+            success = await self.power_intent_service.handle_power_off_intent(device.raw)
 
         if success:
-            self.logger.info(
+            logger.info(
                 "Power state successfully set to %s for device %s.",
-                power_state,
+                self.POWER_ON if power_on else self.POWER_OFF,
                 device_id,
             )
         else:
-            self.logger.error("Failed to set power state for device %s.", device_id)
+            logger.error("Failed to set power state for device %s.", device_id)
 
     def validate_payload(self, payload: dict) -> bool:
         """
@@ -77,13 +71,29 @@ class PowerIntentHandler:
         :return: True if the payload is valid, False otherwise.
         """
         if "powerState" not in payload:
-            self.logger.error("Payload missing 'powerState' key.")
+            logger.error("Payload missing 'powerState' key.")
             return False
 
-        power_state = payload["powerState"].strip().upper()
-
-        if power_state not in [self.POWER_ON, self.POWER_OFF]:
-            self.logger.error("Invalid 'powerState' value: %s", power_state)
+        if self.parse_power_state(payload["powerState"]) is None:
+            logger.error("Invalid 'powerState' value: %s", payload["powerState"])
             return False
 
         return True
+
+    @classmethod
+    def parse_power_state(cls, value):
+        """
+        Map a powerState value to the requested power state.
+
+        Exact "ON"/"OFF" values are resolved with a single lookup; other strings are
+        stripped and upper-cased first, so " on " is still accepted.
+
+        :param value: The powerState value from the payload.
+        :return: True for ON, False for OFF, None if the value is not a valid power state.
+        """
+        if not isinstance(value, str):
+            return None
+        power_on = cls.POWER_STATES.get(value)
+        if power_on is None:
+            power_on = cls.POWER_STATES.get(value.strip().upper())
+        return power_on
@@ -1,12 +1,18 @@
-import json
 import logging
+from ..models.device_ref import DeviceRef
+from ._common import parse_and_validate
 from ..services.speaker_intent_service import SpeakerIntentService
 
+logger = logging.getLogger(__name__)
+
+
 class SpeakerIntentHandler:
     """
     A handler class to process speaker directives for devices.
     """
 
+    __slots__ = ("speaker_intent_service", "_validators", "_actions")
+
     def __init__(self, speaker_intent_service: SpeakerIntentService):
         """
         Initialize the SpeakerIntentHandler with the injected SpeakerIntentService.
@@ -14,24 +20,37 @@ class SpeakerIntentHandler:
         Args:
             speaker_intent_service (SpeakerIntentService): Service for handling speaker commands.
         """
-        self.logger = logging.getLogger(__name__)
         self.speaker_intent_service = speaker_intent_service
 
+        # Payload validator and action for each supported (subcategory, command) pair
+        self._validators = {
+            ("volume", "set"): self._validate_volume_set,
+            ("volume", "increase"): self._validate_volume_step,
+            ("volume", "decrease"): self._validate_volume_step,
+            ("mute", "set"): self._validate_mute_set,
+        }
+        self._actions = {
+            ("volume", "set"): self._set_volume,
+            ("volume", "increase"): self._increase_volume,
+            ("volume", "decrease"): self._decrease_volume,
+            ("mute", "set"): self._set_mute,
+        }
+
     async def handle_speaker_command(
-        self, device_type: str, device: dict,  subcategory: str, command: str, payload
+        self, device_type: str, device: DeviceRef,  subcategory: str, command: str, payload
     ):
         """
         Handle the speaker command directive for a given device.
 
         Args:
             device_type (str): The type of the device (e.g., 'tv').
-            device (dict): The device configuration dictionary.
+            device (DeviceRef): The device reference, wrapping the device configuration dictionary.
             subcategory (str): The speaker subcategory (e.g., 'volume', 'mute').
             command (str): The command to execute (e.g., 'set', 'increase', 'decrease').
-            payload (str or dict): JSON string or dictionary containing speaker command information.
+            payload (bytes, str or dict): JSON bytes, string or dictionary containing speaker command information.
         """
-        device_id = device.get("device_id") or device.get("object_id")
-        self.logger.info(
+        device_id = device.device_id
+        logger.info(
             "Handling speaker command: Device Type: %s, Device: %s, Subcategory: %s, Command: %s, Payload: %s",
             device_type,
             device_id,
@@ -39,86 +58,32 @@ class SpeakerIntentHandler:
             command,
             payload,
         )
-    
-
-        # Ensure payload is a dictionary by parsing JSON if it's a string
-        if isinstance(payload, str):
-            try:
-                payload_dict = json.loads(payload)
-            except json.JSONDecodeError as e:
-                self.logger.error("Failed to decode JSON payload: %s", e)
-                return
-        else:
-            payload_dict = payload
 
-        # Validate the payload structure and content
-        if not await self.validate_payload(payload_dict, subcategory, command):
-            self.logger.error("Invalid payload: %s", payload_dict)
+        # Parse the payload and validate its structure and content
+        payload_dict = parse_and_validate(payload, self.validate_payload, logger, subcategory, command)
+        if payload_dict is None:
             return
 
-        # Handle volume commands
-        if subcategory == "volume":
-            if command == "set":
-                volume = payload_dict.get("volume")
-                if volume is not None and isinstance(volume, int):
-                    success = await self.speaker_intent_service.handle_volume_intent(
-                        device, command, volume
-                    )
-                else:
-                    self.logger.error("Invalid or missing volume for 'set' command.")
-                    success = False
-            elif command in ["increase", "decrease"]:
-                step = payload_dict.get("step", 1)  # Default step to 1 if not provided
-                if not isinstance(step, int) or step < 1:
-                    self.logger.warning(
-                        "Invalid or missing step value; defaulting to 1."
-                    )
-                    step = 1
-                success = await self.speaker_intent_service.handle_volume_intent(
-                    device, command, step=step
-                )
-            else:
-                self.logger.error("Invalid volume command: %s", command)
-                success = False
-
-        # Handle mute commands
-        elif subcategory == "mute":
-            mute = payload_dict.get("mute")
-            if command == "set":
-                if isinstance(mute, bool):
-                    if mute:
-                        success = await self.speaker_intent_service.handle_volume_intent(
-                            device, "mute"
-                        )
-                    else:
-                        success = await self.speaker_intent_service.handle_volume_intent(
-                            device, "unmute"
-                        )
-                else:
-                    self.logger.error(
-                        "Invalid mute value received, must be a boolean: %s", mute
-                    )
-                    success = False
-            else:
-                self.logger.error("Invalid mute command: %s", command)
-                success = False
-
+        # Dispatch to the action registered for this subcategory and command
+        action = self._actions.get((subcategory, command))
+        if action:
+            success = await action(device.raw, payload_dict)
         else:
-            self.logger.error("Unknown subcategory: %s", subcategory)
+            logger.error("Unknown speaker command: %s - %s", subcategory, command)
             success = False
 
         if success:
-            self.logger.info(
+            logger.info(
                 "Successfully executed speaker command '%s' for device %s.",
                 command,
                 device_id,
             )
         else:
-            self.logger.error(
+            logger.error(
                 "Failed to execute speaker command for device %s.", device_id
             )
 
-    async def validate_payload(self, payload: dict, subcategory: str, command: str) -> bool:
+    def validate_payload(self, payload: dict, subcategory: str, command: str) -> bool:
         """
         Validate the structure and content of the payload based on the subcategory and command.
 
@@ -130,40 +95,75 @@ class SpeakerIntentHandler:
         Returns:
             bool: True if the payload is valid, False otherwise.
         """
-        # Validate payload for volume commands
-        if subcategory == "volume":
-            if command == "set":
-                if "volume" not in payload or not isinstance(payload["volume"], int):
-                    self.logger.error(
-                        "Payload missing 'volume' key or invalid value for 'set' command."
-                    )
-                    return False
-            elif command in ["increase", "decrease"]:
-                # No specific requirement for 'step', defaults to 1 if missing
-                if "step" in payload and not isinstance(payload["step"], int):
-                    self.logger.warning(
-                        "Invalid 'step' value, must be an integer: %s", payload["step"]
-                    )
-                    return False
-            else:
-                self.logger.error("Invalid command for volume: %s", command)
-                return False
-
-        # Validate payload for mute commands
-        elif subcategory == "mute":
-            if command == "set" and "mute" not in payload:
-                self.logger.error("Payload missing 'mute' key for 'mute' command.")
-                return False
-            if "mute" in payload and not isinstance(payload["mute"], bool):
-                self.logger.error(
-                    "Invalid 'mute' value, must be a boolean: %s", payload["mute"]
-                )
-                return False
+        validator = self._validators.get((subcategory, command))
+        if validator is None:
+            logger.error(
+                "Unknown speaker command in payload validation: %s - %s", subcategory, command
+            )
+            return False
+        return validator(payload)
 
-        else:
-            self.logger.error(
-                "Unknown subcategory in payload validation: %s", subcategory
+    def _validate_volume_set(self, payload: dict) -> bool:
+        """Validate the payload of a 'volume/set' command."""
+        if "volume" not in payload or not isinstance(payload["volume"], int):
+            logger.error(
+                "Payload missing 'volume' key or invalid value for 'set' command."
             )
             return False
+        return True
 
+    def _validate_volume_step(self, payload: dict) -> bool:
+        """Validate the payload of a 'volume/increase' or 'volume/decrease' command."""
+        # No specific requirement for 'step', defaults to 1 if missing
+        if "step" in payload and not isinstance(payload["step"], int):
+            logger.warning(
+                "Invalid 'step' value, must be an integer: %s", payload["step"]
+            )
+            return False
         return True
+
+    def _validate_mute_set(self, payload: dict) -> bool:
+        """Validate the payload of a 'mute/set' command."""
+        if "mute" not in payload:
+            logger.error("Payload missing 'mute' key for 'mute' command.")
+            return False
+        if not isinstance(payload["mute"], bool):
+            logger.error(
+                "Invalid 'mute' value, must be a boolean: %s", payload["mute"]
+            )
+            return False
+        return True
+
+    async def _set_volume(self, device: dict, payload: dict) -> bool:
+        """Set the volume to the absolute value given in the payload."""
+        return await self.speaker_intent_service.handle_volume_intent(
+            device, "set", payload["volume"]
+        )
+
+    async def _increase_volume(self, device: dict, payload: dict) -> bool:
+        """Increase the volume by the payload's step."""
+        return await self.speaker_intent_service.handle_volume_intent(
+            device, "increase", step=self._get_step(payload)
+        )
+
+    async def _decrease_volume(self, device: dict, payload: dict) -> bool:
+        """Decrease the volume by the payload's step."""
+        return await self.speaker_intent_service.handle_volume_intent(
+            device, "decrease", step=self._get_step(payload)
+        )
+
+    async def _set_mute(self, device: dict, payload: dict) -> bool:
+        """Mute or unmute the speaker according to the payload."""
+        return await self.speaker_intent_service.handle_volume_intent(
+            device, "mute" if payload["mute"] else "unmute"
+        )
+
+    def _get_step(self, payload: dict) -> int:
+        """Return the volume step from the payload, defaulting to 1."""
+        step = payload.get("step", 1)  # Default step to 1 if not provided
+        if not isinstance(step, int) or step < 1:
+            logger.warning(
+                "Invalid or missing step value; defaulting to 1."
+            )
+            step = 1
+        return step
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+
+# Key under which from_config stores the resolved identifier on the device dictionary
+CANONICAL_ID_KEY = "_canonical_id"
+
+
+def canonical_id(device: dict) -> str:
+    """
+    Return a device configuration's identifier: its 'device_id', or its 'object_id' if it has none.
+
+    Dictionaries that went through DeviceRef.from_config answer with a single lookup.
+
+    Args:
+        device (dict): The device configuration dictionary.
+
+    Returns:
+        str: The device identifier.
+    """
+    try:
+        return device[CANONICAL_ID_KEY]
+    except KeyError:
+        return device.get("device_id") or device.get("object_id")
+
+
+@dataclass(slots=True, frozen=True)
+class DeviceRef:
+    """
+    A configured Bravia device, with its identifier resolved once at load time.
+
+    Attributes:
+        device_id (str): The device's 'device_id', or its 'object_id' if it has none.
+        raw (dict): The device configuration as read from config.json.
+    """
+
+    device_id: str
+    raw: dict
+
+    @classmethod
+    def from_config(cls, device: dict) -> "DeviceRef":
+        """
+        Build a DeviceRef from a device configuration dictionary.
+
+        The resolved identifier is also stored on the dictionary (see canonical_id) so
+        the services, which receive the raw dictionary, do not have to resolve it again.
+
+        Args:
+            device (dict): The device configuration dictionary.
+
+        Returns:
+            DeviceRef: The device reference.
+        """
+        device_id = device.get("device_id") or device.get("object_id")
+        device[CANONICAL_ID_KEY] = device_id
+        return cls(device_id, device)
@@ -1,18 +1,29 @@
-import fnmatch
-import json
+import asyncio
 import logging
 import os
+from pathlib import Path
+
+import orjson
+
 from app.plugins.bravia.handlers.input_intent_handler import InputIntentHandler
 from app.plugins.bravia.handlers.launch_intent_handler import LaunchIntentHandler
 from app.plugins.bravia.handlers.playback_intent_handler import PlaybackIntentHandler
 from app.plugins.bravia.handlers.speaker_intent_handler import SpeakerIntentHandler
+from app.plugins.bravia.models.device_ref import DeviceRef
 from app.plugins.bravia.services.input_intent_service import InputIntentService
 from app.plugins.bravia.services.launch_intent_service import LaunchIntentService
 from app.plugins.bravia.services.playback_intent_service import PlaybackIntentService
 from app.plugins.bravia.services.power_intent_service import PowerIntentService
 from app.plugins.bravia.services.speaker_intent_service import SpeakerIntentService
+from app.plugins.bravia.services.tv_service import TVService
 from app.plugins.plugin_interface import IotPlugin
 from app.plugins.bravia.handlers.power_intent_handler import PowerIntentHandler
+from app.utils import TopicTrie
+
+# Plugin directory and the files it contains, resolved once at import
+_PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
+_RESOURCES_DIR = os.path.join(_PLUGIN_DIR, 'resources')
+_CONFIG_PATH = os.path.join(_PLUGIN_DIR, 'config.json')
 
 class BraviaPlugin(IotPlugin):
     def __init__(self):
@@ -25,18 +36,40 @@ class BraviaPlugin(IotPlugin):
             "domus/devices/tv/+/launcher",
             "domus/devices/tv/+/input",
         ]
+
+        # Index of the plugin's topic filters, used by can_handle_topic
+        self._topic_trie = TopicTrie()
+        for topic in self.bravia_topics:
+            self._topic_trie.insert(topic, topic)
+
+        # Literal levels shared by all topic filters (e.g. "domus/devices/tv"), checked
+        # before the trie so unrelated topics are rejected without splitting them.
+        # The trailing '/' is left out, as a '#' filter also matches its parent level.
+        literal_parts = [topic.split("+", 1)[0].split("#", 1)[0] for topic in self.bravia_topics]
+        common_prefix = os.path.commonprefix(literal_parts)
+        self._topic_prefix = common_prefix[:max(common_prefix.rfind("/"), 0)]
         
-        self.devices = []  # To store device configurations
+        self.devices = []  # To store device references (DeviceRef) built from the configurations
+        self._device_index = {}  # device_id / object_id -> DeviceRef, built in initialize
 
-        # Dynamically determine the plugin's base directory
-        self.plugin_directory = os.path.dirname(os.path.abspath(__file__))
+        # The plugin's base directory
+        self.plugin_directory = _PLUGIN_DIR
         
         # Define handlers for different command categories
         self.power_handler = PowerIntentHandler(PowerIntentService())
         self.speaker_handler = SpeakerIntentHandler(SpeakerIntentService())
         self.playback_handler = PlaybackIntentHandler(PlaybackIntentService())
-        self.launch_handler = LaunchIntentHandler(LaunchIntentService(self.plugin_directory))
-        self.input_handler = InputIntentHandler(InputIntentService(self.plugin_directory))
+        self.launch_handler = LaunchIntentHandler(LaunchIntentService(_RESOURCES_DIR))
+        self.input_handler = InputIntentHandler(InputIntentService(_RESOURCES_DIR))
+
+        # Command category (5th topic level) -> dispatcher for that category
+        self._category_dispatch = {
+            "power": self._dispatch_power,
+            "speaker": self._dispatch_speaker,
+            "playback": self._dispatch_playback,
+            "launcher": self._dispatch_launcher,
+            "input": self._dispatch_input,
+        }
                 
 
     async def initialize(self):
@@ -47,15 +80,15 @@ class BraviaPlugin(IotPlugin):
         self.logger.info("Initializing Bravia Plugin...")
         
         # Load config.json from the plugin directory
-        config_file_path = os.path.join(os.path.dirname(__file__), 'config.json')
+        config_file_path = _CONFIG_PATH
         
         if not os.path.exists(config_file_path):
             self.logger.error("Config file not found at path: %s", config_file_path)
             return
         
         try:
-            with open(config_file_path, 'r') as f:
-                config_data = json.load(f)
+            # Read the file off the event loop thread so other coroutines keep running
+            config_data = orjson.loads(await asyncio.to_thread(Path(config_file_path).read_bytes))
                 
             # Validate the device configurations
             if 'devices' not in config_data:
@@ -67,23 +100,29 @@ class BraviaPlugin(IotPlugin):
                     self.logger.error("Device must contain at least one of 'device_id' or 'object_id'")
                     continue  # Skip invalid entries
                 
-                self.devices.append(device)  # Add the valid device to the list
+                device_ref = DeviceRef.from_config(device)
+                self.devices.append(device_ref)  # Add the valid device to the list
+
+                # Index the device under both identifiers; the first device listed wins
+                for key in ('device_id', 'object_id'):
+                    identifier = device.get(key)
+                    if identifier:
+                        self._device_index.setdefault(identifier, device_ref)
 
             self.logger.info(f"Loaded {len(self.devices)} devices from config.json")
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error("Failed to parse config.json: %s", e)        
 
     def can_handle_topic(self, topic: str) -> bool:
         """
         Determine if this plugin can handle the given topic.
         
-        This function uses the `fnmatch` module to match the incoming topic with the topics
-        that the plugin is subscribed to. Since MQTT topics can contain wildcards (`+` and `#`),
-        we translate those wildcards to the equivalent shell-style wildcards supported by `fnmatch`:
+        The incoming topic is matched against the topics the plugin is subscribed to
+        using a topic trie built once in `__init__`, following the MQTT wildcard rules:
         
-        - The `+` MQTT wildcard is converted to `*` in `fnmatch`, which matches any single-level element in the topic.
-        - The `#` MQTT wildcard is converted to `**` in `fnmatch`, which matches multiple levels in the topic hierarchy.
+        - The `+` wildcard matches exactly one level in the topic.
+        - The `#` wildcard matches any number of remaining levels in the topic hierarchy.
         
         For example:
         - `domus/devices/tv/+/power/set` will match `domus/devices/tv/uuid:12345/power/set`
@@ -95,12 +134,9 @@ class BraviaPlugin(IotPlugin):
         Returns:
         - bool: True if the plugin can handle the topic, False otherwise.
         """
-        for t in self.bravia_topics:
-            # Convert MQTT wildcards (+ -> *, # -> **) to fnmatch-compatible wildcards
-            pattern = t.replace("+", "*").replace("#", "**")
-            if fnmatch.fnmatch(topic, pattern):
-                return True
-        return False
+        if not topic.startswith(self._topic_prefix):
+            return False
+        return bool(self._topic_trie.match(topic))
 
     
     def get_topics(self) -> list:
@@ -109,22 +145,22 @@ class BraviaPlugin(IotPlugin):
         """
         return self.bravia_topics
 
-    async def process_message(self, topic: str, payload_str: str):
+    async def process_message(self, topic: str, payload_str: bytes):
         """
         Process the received message for a specific topic.
         
         Parameters:
         - topic: MQTT topic received
-        - payload_str: JSON payload (received as a string) for the topic
+        - payload_str: JSON payload (received as raw bytes) for the topic
         """
         try:
-            # Parse the topic to extract necessary parts
-            topic_parts = topic.split("/")
+            # Parse the topic to extract necessary parts; no command uses more than 7 levels
+            topic_parts = topic.split("/", 6)
 
             if len(topic_parts) >= 5:
-                base_topic, devices, device_type, device_id, category = topic_parts[0:5]
-
-                device_id = topic_parts[3] if len(topic_parts) > 3 else None
+                device_type = topic_parts[2]
+                device_id = topic_parts[3]
+                category = topic_parts[4]
 
                 if not device_id:
                     self.logger.error("Device ID not found in topic")
@@ -137,76 +173,99 @@ class BraviaPlugin(IotPlugin):
                     self.logger.warning("No matching device found for ID: %s", device_id)
                     return
             
-                # Check if the topic is specifically for TV devices power set
-                if (
-                    device_type == "tv"
-                    and category == "power"
-                    and len(topic_parts) == 6
-                    and topic_parts[5] == "set"
-                ):
-                    self.logger.info(f"Handling power command for {device_id}")
-                    await self.power_handler.handle_power_set(
-                        device_type, device, payload_str
-                    )
-
-                # Handling Speaker Commands
-                elif (
-                    device_type == "tv" and category == "speaker" and len(topic_parts) >= 7
-                ):
-                    subcategory = topic_parts[5]  # 'volume' or 'mute'
-                    action = topic_parts[6]
-                    self.logger.info(f"Handling speaker command: {subcategory} - {action}")
-                    await self.speaker_handler.handle_speaker_command(
-                        device_type, device, subcategory, action, payload_str
-                    )
-
-                # Handling Playback Commands
-                elif (
-                    device_type == "tv" and category == "playback" and len(topic_parts) >= 6
-                ):
-                    action = topic_parts[5]
-                    self.logger.info(f"Handling playback command: {action}")
-                    await self.playback_handler.handle_playback_command(
-                        device_type, device, action, payload_str
-                    )
-
-                # Handling Launch Commands
-                elif device_type == "tv" and category == "launcher":
-                    self.logger.info(f"Handling launch command for {device_id}")
-                    await self.launch_handler.handle_launch_command(
-                        device_type, device, payload_str
-                    )
-
-                # Check if the topic is for TV input change
-                elif device_type == "tv" and category == "input":
-                    self.logger.info(f"Handling input change for {device_id}")
-                    await self.input_handler.handle_input_change(
-                        device_type, device, payload_str
-                    )
-                else:
-                    self.logger.warning(f"Unrecognized command category: {category}")
+                # Dispatch on the command category; each dispatcher checks the rest of the topic
+                dispatch = self._category_dispatch.get(category) if device_type == "tv" else None
+                if not dispatch or not await dispatch(device_type, device, topic_parts, payload_str):
+                    self.logger.warning("Unrecognized command category: %s", category)
             else:
-                self.logger.error(f"Malformed topic: {topic}")
+                self.logger.error("Malformed topic: %s", topic)
 
-        except json.JSONDecodeError:
-            self.logger.error(f"Failed to decode payload for topic {topic}: {payload_str}")
+        except orjson.JSONDecodeError:
+            self.logger.error("Failed to decode payload for topic %s: %s", topic, payload_str)
         except Exception as e:
-            self.logger.error(f"Error processing message on topic {topic}: {e}")
+            self.logger.error("Error processing message on topic %s: %s", topic, e)
+
+    async def process_messages(self, messages: list):
+        """
+        Process a batch of received messages.
+
+        Messages are grouped by the device ID in their topic. Each device's messages are
+        processed in arrival order, while different devices are handled concurrently.
+
+        Parameters:
+        - messages: List of (topic, payload) tuples
+        """
+        by_device = {}
+        for topic, payload_str in messages:
+            topic_parts = topic.split("/", 4)
+            device_id = topic_parts[3] if len(topic_parts) > 3 else None
+            by_device.setdefault(device_id, []).append((topic, payload_str))
+
+        if len(by_device) == 1:
+            await self._process_in_order(messages)
+        else:
+            await asyncio.gather(*(self._process_in_order(items) for items in by_device.values()))
+
+    async def _process_in_order(self, messages: list):
+        """Process messages one after the other, in the given order."""
+        for topic, payload_str in messages:
+            await self.process_message(topic, payload_str)
+
+    async def _dispatch_power(self, device_type, device, topic_parts, payload_str) -> bool:
+        """Handle '<device_id>/power/set' topics."""
+        if len(topic_parts) != 6 or topic_parts[5] != "set":
+            return False
+        self.logger.info("Handling power command for %s", topic_parts[3])
+        await self.power_handler.handle_power_set(device_type, device, payload_str)
+        return True
+
+    async def _dispatch_speaker(self, device_type, device, topic_parts, payload_str) -> bool:
+        """Handle '<device_id>/speaker/<subcategory>/<action>' topics."""
+        if len(topic_parts) < 7:
+            return False
+        subcategory = topic_parts[5]  # 'volume' or 'mute'
+        action = topic_parts[6]
+        self.logger.info("Handling speaker command: %s - %s", subcategory, action)
+        await self.speaker_handler.handle_speaker_command(
+            device_type, device, subcategory, action, payload_str
+        )
+        return True
+
+    async def _dispatch_playback(self, device_type, device, topic_parts, payload_str) -> bool:
+        """Handle '<device_id>/playback/<action>' topics."""
+        if len(topic_parts) < 6:
+            return False
+        action = topic_parts[5]
+        self.logger.info("Handling playback command: %s", action)
+        await self.playback_handler.handle_playback_command(
+            device_type, device, action, payload_str
+        )
+        return True
+
+    async def _dispatch_launcher(self, device_type, device, topic_parts, payload_str) -> bool:
+        """Handle '<device_id>/launcher' topics."""
+        self.logger.info("Handling launch command for %s", topic_parts[3])
+        await self.launch_handler.handle_launch_command(device_type, device, payload_str)
+        return True
+
+    async def _dispatch_input(self, device_type, device, topic_parts, payload_str) -> bool:
+        """Handle '<device_id>/input' topics."""
+        self.logger.info("Handling input change for %s", topic_parts[3])
+        await self.input_handler.handle_input_change(device_type, device, payload_str)
+        return True
 
     def get_device_by_id(self, identifier: str):
         """
         Retrieve a device by either device_id or object_id.
         
         :param identifier: The device_id or object_id to search for.
-        :return: The device configuration if found, else None.
+        :return: The device reference if found, else None.
         """
-        for device in self.devices:
-            if device.get('device_id') == identifier or device.get('object_id') == identifier:
-                return device
-        return None
+        return self._device_index.get(identifier)
     
     async def shutdown(self):
         """
         Clean-up logic for the plugin during shutdown.
         """
         self.logger.info("Shutting down Bravia Plugin...")
+        await TVService.aclose()
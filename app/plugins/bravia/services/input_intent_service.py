@@ -1,9 +1,12 @@
 import logging
 import os
 
+from ..models.device_ref import canonical_id
 from .tv_service import TVService
 from ..utils.tv_input_mapper import TVInputMapper
 
+logger = logging.getLogger(__name__)
+
 
 class InputIntentService:
     """
@@ -14,7 +17,6 @@ class InputIntentService:
         """
         Initialize the InputIntentService.
         """
-        self.logger = logging.getLogger(__name__)
         # Ensure the plugin directory contains the 'resources' subdirectory
         if not plugin_directory.endswith('resources'):
             resources_dir = os.path.join(plugin_directory, 'resources')
@@ -22,9 +24,9 @@ class InputIntentService:
             resources_dir = plugin_directory
 
         if not os.path.isdir(resources_dir):
-            self.logger.error(f"Resources directory not found in {resources_dir}.")
+            logger.error(f"Resources directory not found in {resources_dir}.")
         # else:
-        #     self.logger.info(f"Loading Alexa input mappings from {resources_dir}")
+        #     logger.info(f"Loading Alexa input mappings from {resources_dir}")
 
         # Load Alexa input mappings
         input_mappings_file_path = os.path.join(resources_dir, 'input_mappings.json')
@@ -41,19 +43,19 @@ class InputIntentService:
         Returns:
             bool: True if the input source was successfully changed, False otherwise.
         """
-        device_id = device.get("device_id") or device.get("object_id")
-        self.logger.info(
+        device_id = canonical_id(device)
+        logger.info(
             "Changing input to '%s' on device: %s", input_source, device_id
         )
 
-        tv_service = TVService(device)
+        tv_service = TVService.for_device(device)
 
         try:
             tv_source = self.tv_input_mapper.get_tv_input_command(input_source)
             await tv_service.change_input(tv_source)
             return True
         except Exception as e:
-            self.logger.error(
+            logger.error(
                 "Failed to change input to '%s' on device %s: %s",
                 input_source,
                 device_id,
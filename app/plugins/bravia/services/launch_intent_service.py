@@ -1,10 +1,14 @@
 import logging
 import os
+import time
 
 from app.config import Config
+from ..models.device_ref import canonical_id
 from .tv_service import TVService
 from ..utils.tv_app_mapper import TVAppMapper
 
+logger = logging.getLogger(__name__)
+
 class LaunchIntentService:
     """
     Asynchronous service class to handle launch intents for Sony Bravia TVs.
@@ -62,16 +66,20 @@ class LaunchIntentService:
         "prev": "Prev",
         "next": "Next",
     }
+    # The same mapping keyed by the '__command__' form used in alexa_apps.json
+    _goto_commands = {f"__{key}__": command for key, command in _command_mappings.items()}
+
+    # How long a TV's app list is reused before it is fetched again, in seconds
+    APP_LIST_TTL = 300
 
     def __init__(self, plugin_directory):
         """
         Initialize the LaunchIntentService.
-
-        Sets up logging for the service to track intent handling and errors.
         """
-        self.logger = logging.getLogger(__name__)
         self.config = Config()
         self.tv_app_mapper = TVAppMapper()
+        self._app_lists = {}  # device id -> (monotonic fetch time, app list)
+        self._mapped_app_list = None  # App list last passed to the TVAppMapper
 
         # Ensure the plugin directory contains the 'resources' subdirectory
         if not plugin_directory.endswith('resources'):
@@ -80,14 +88,36 @@ class LaunchIntentService:
             resources_dir = plugin_directory
 
         if not os.path.isdir(resources_dir):
-            self.logger.error(f"Resources directory not found in {resources_dir}.")
+            logger.error(f"Resources directory not found in {resources_dir}.")
         # else:
-        #     self.logger.info(f"Loading Alexa app mappings from {resources_dir}")
+        #     logger.info(f"Loading Alexa app mappings from {resources_dir}")
 
         # Load Alexa app mappings only once at initialization
         alexa_apps_file_path = os.path.join(resources_dir, 'alexa_apps.json')
         self.tv_app_mapper.load_alexa_apps(alexa_apps_file_path)
         
+    async def get_app_list(self, device, tv_service):
+        """
+        Return the TV's app list, fetching it from the TV at most once per APP_LIST_TTL.
+
+        Args:
+            device (dict): The device configuration dictionary.
+            tv_service (TVService): The service used to query the TV.
+
+        Returns:
+            list: The apps installed on the TV, or None/empty if they could not be retrieved.
+        """
+        device_id = canonical_id(device)
+        now = time.monotonic()
+        cached = self._app_lists.get(device_id)
+        if cached and now - cached[0] < self.APP_LIST_TTL:
+            return cached[1]
+
+        app_info = await tv_service.get_app_list()  # Use TVService to get app list
+        if app_info:
+            self._app_lists[device_id] = (now, app_info)
+        return app_info
+
     async def launch_app(self, device, alexa_identifier):
         """
         Asynchronously launch an app on the specified device using Alexa identifier.
@@ -99,23 +129,25 @@ class LaunchIntentService:
         Returns:
             bool: True if the app was successfully launched, False otherwise.
         """
-        self.logger.info(
+        logger.info(
             "Launching app with Alexa identifier '%s' on device: %s",
             alexa_identifier,
             device,
         )
 
-        tv_service = TVService(device)
+        tv_service = TVService.for_device(device)
         # Dynamically load TV apps using the TVService
         try:
-            app_info = await tv_service.get_app_list()  # Use TVService to get app list
+            app_info = await self.get_app_list(device, tv_service)
             if app_info:
-                self.tv_app_mapper.set_tv_apps(app_info)  # Update TV app mappings
+                if app_info is not self._mapped_app_list:
+                    self.tv_app_mapper.set_tv_apps(app_info)  # Update TV app mappings
+                    self._mapped_app_list = app_info
             else:
-                self.logger.error("Received an empty app list from TV.")
+                logger.error("Received an empty app list from TV.")
                 return False
         except Exception as e:
-            self.logger.error("Failed to load TV app list: %s", e)
+            logger.error("Failed to load TV app list: %s", e)
             return False
 
         # Convert Alexa app identifier to TV app identifier using TVAppMapper
@@ -124,7 +156,7 @@ class LaunchIntentService:
         )
 
         if not tv_app_identifier:
-            self.logger.error(
+            logger.error(
                 "No matching TV app identifier found for Alexa identifier: %s",
                 alexa_identifier,
             )
@@ -132,21 +164,20 @@ class LaunchIntentService:
 
         try:
             if tv_app_identifier.startswith("__") and tv_app_identifier.endswith("__"):
-                # Extract command without the underscores
-                command_key = tv_app_identifier.strip("__").lower()
-                command = self._command_mappings.get(command_key)
+                # Look up the '__command__' identifier directly, ignoring case
+                command = self._goto_commands.get(tv_app_identifier.lower())
 
                 if command:
-                    self.logger.info(
+                    logger.info(
                         "Executing goto command '%s' for TV input '%s'.",
-                        command_key,
+                        tv_app_identifier,
                         command,
                     )
                     await tv_service.goto(command)
                 else:
-                    self.logger.error(
+                    logger.error(
                         "Invalid command '%s' received; no matching TV command found.",
-                        command_key,
+                        tv_app_identifier,
                     )
                     return False
             else:
@@ -155,7 +186,7 @@ class LaunchIntentService:
 
             return True
         except Exception as e:
-            self.logger.error(
+            logger.error(
                 "Failed to launch app or execute command '%s' on device %s: %s",
                 tv_app_identifier,
                 device,
@@ -1,16 +1,16 @@
 import logging
 
+from ..models.device_ref import canonical_id
 from .tv_service import TVService
 
+logger = logging.getLogger(__name__)
+
 
 class PowerIntentService:
     """
     Asynchronous service class to handle 'Power On' and 'Power Off' intents for Sony Bravia TVs.
     """
 
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-
     async def handle_power_on_intent(self, device_config: dict) -> bool:
         """
         Asynchronously handle the 'Power On' intent for the specified device.
@@ -21,14 +21,15 @@ class PowerIntentService:
         Returns:
             bool: True if the TV was successfully powered on, False otherwise.
         """
-        self.logger.info("Handling Power On intent for device: %s", device_config["device_id"])
-        tv_service = TVService(device_config)
+        device_id = canonical_id(device_config)
+        logger.info("Handling Power On intent for device: %s", device_id)
+        tv_service = TVService.for_device(device_config)
         try:
             await tv_service.turn_on()
-            self.logger.info("TV %s has been powered on.", device_config["device_id"])
+            logger.info("TV %s has been powered on.", device_id)
             return True
         except Exception as e:
-            self.logger.error("Failed to connect to TV %s: %s", device_config["device_id"], e)
+            logger.error("Failed to connect to TV %s: %s", device_id, e)
             return False
 
     async def handle_power_off_intent(self, device_config: dict) -> bool:
@@ -41,13 +42,14 @@ class PowerIntentService:
         Returns:
             bool: True if the TV was successfully powered off, False otherwise.
         """
-        self.logger.info("Handling Power Off intent for device: %s", device_config["device_id"])
-        tv_service = TVService(device_config)
+        device_id = canonical_id(device_config)
+        logger.info("Handling Power Off intent for device: %s", device_id)
+        tv_service = TVService.for_device(device_config)
         try:
             await tv_service.turn_off()
-            self.logger.info("TV %s has been powered off.", device_config["device_id"])
+            logger.info("TV %s has been powered off.", device_id)
             return True
         except Exception as e:
-            self.logger.error("Failed to connect to TV %s: %s", device_config["device_id"], e)
+            logger.error("Failed to connect to TV %s: %s", device_id, e)
             return False
 
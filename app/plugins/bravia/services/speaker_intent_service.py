@@ -1,6 +1,18 @@
 import logging
+from ..models.device_ref import canonical_id
 from .tv_service import TVService
 
+logger = logging.getLogger(__name__)
+
+# Volume command -> TVService call, each taking (tv_service, volume, step)
+_DISPATCH = {
+    "increase": lambda tv_service, volume, step: tv_service.volume_up(step),
+    "decrease": lambda tv_service, volume, step: tv_service.volume_down(step),
+    "mute": lambda tv_service, volume, step: tv_service.mute(),
+    "unmute": lambda tv_service, volume, step: tv_service.unmute(),
+    "set": lambda tv_service, volume, step: tv_service.set_volume(volume),
+}
+
 class SpeakerIntentService:
     """
     Asynchronous service class to handle 'Volume' intents for Sony Bravia TVs.
@@ -9,19 +21,11 @@ class SpeakerIntentService:
     intents received from an Alexa skill or similar service.
     """
 
-    def __init__(self):
-        """
-        Initialize the SpeakerIntentService.
-
-        Sets up logging for the service to track intent handling and errors.
-        """
-        self.logger = logging.getLogger(__name__)
-
     async def handle_volume_intent(self, device: dict, volume_command: str, volume: int = None, step: int = 1) -> bool:
         """
         Asynchronously handle the 'Volume' intent for the specified device.
 
-        This method creates an instance of TVService for the given device and attempts
+        This method gets the TVService for the given device and attempts
         to adjust the volume based on the volume_command and volume or step (if applicable).
         Logs success or failure.
 
@@ -34,8 +38,8 @@ class SpeakerIntentService:
         Returns:
             bool: True if the volume was successfully adjusted, False otherwise.
         """
-        device_id = device.get("device_id") or device.get("object_id")
-        self.logger.info(
+        device_id = canonical_id(device)
+        logger.info(
             "Handling Volume intent for device: %s with command: %s, volume: %s, step: %s",
             device_id,
             volume_command,
@@ -43,37 +47,28 @@ class SpeakerIntentService:
             step,
         )
 
-        # Create TVService instance using the device configuration dictionary
-        tv_service = TVService(device)
+        # Get the TVService for the device configuration dictionary
+        tv_service = TVService.for_device(device)
 
         try:
             # Adjust volume based on the command provided
-            if volume_command == "increase":
-                await tv_service.volume_up(step)  # Increase the volume by step
-            elif volume_command == "decrease":
-                await tv_service.volume_down(step)  # Decrease the volume by step
-            elif volume_command == "mute":
-                await tv_service.mute()  # Mute the TV
-            elif volume_command == "unmute":
-                await tv_service.unmute()  # Unmute the TV
-            elif volume_command == "set":
-                if volume is not None and isinstance(volume, int):
-                    await tv_service.set_volume(volume)  # Set the volume to the specified level
-                else:
-                    self.logger.error("Invalid or missing volume for 'set' command.")
-                    return False
-            else:
+            action = _DISPATCH.get(volume_command)
+            if action is None:
                 # Log an error if an invalid volume command is received
-                self.logger.error("Invalid volume command: %s", volume_command)
+                logger.error("Invalid volume command: %s", volume_command)
+                return False
+            if volume_command == "set" and not isinstance(volume, int):
+                logger.error("Invalid or missing volume for 'set' command.")
                 return False
+            await action(tv_service, volume, step)
 
             # Log success and return True if the volume adjustment was successful
-            self.logger.info("TV %s volume adjusted: %s", device_id, volume_command)
+            logger.info("TV %s volume adjusted: %s", device_id, volume_command)
             return True
 
         except Exception as e:
             # Log and return False if there was an issue adjusting the volume
-            self.logger.error(
+            logger.error(
                 "Failed to adjust volume on TV %s for command %s: %s",
                 device_id,
                 volume_command,
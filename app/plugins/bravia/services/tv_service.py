@@ -1,14 +1,66 @@
+import asyncio
 import json
 import logging
+import os
+import random
+import tempfile
 
 from pybravia import BraviaClient, BraviaError
 
+from ..models.device_ref import canonical_id
+
+logger = logging.getLogger(__name__)
+
+
+def _atomic_write(file_path, payload: bytes):
+    """
+    Write bytes to a uniquely named temporary file next to file_path, then move it
+    into place. Concurrent writers to the same path never share a temporary file.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(file_path)),
+        prefix=f".{os.path.basename(file_path)}.",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# Returned by TVService._call when the TV could not be reached or the request failed
+_FAILED = object()
+
 
 class TVService:
     """
     Asynchronous service class to handle all interactions with the Sony Bravia TV.
+
+    The control methods (turn_on, set_volume, play, launch_app, ...) log their own
+    errors and return True if the TV accepted the request, False otherwise.
     """
 
+    # TVService instances by device identifier, reused across intents (see for_device)
+    _instances = {}
+    # Background close_client tasks, referenced until they finish (see _close_in_background)
+    _closing = set()
+
+    # Seconds an authenticated client may sit unused before it is disconnected
+    CLIENT_IDLE_TTL = 30
+
+    # Wait after a failed connect, in seconds; doubles per failure up to the maximum
+    CONNECT_BACKOFF_MIN = 0.5
+    CONNECT_BACKOFF_MAX = 30
+
+    # Control methods accepted by execute_batch
+    BATCH_OPS = frozenset({
+        "turn_on", "turn_off", "set_volume", "volume_up", "volume_down", "mute", "unmute",
+        "play", "pause", "stop", "previous", "next", "launch_app", "change_input", "goto",
+    })
+
     def __init__(self, device_config: dict):
         """
         Initialize the TVService with the device-specific settings from the configuration.
@@ -16,9 +68,9 @@ class TVService:
         Args:
             device_config (dict): The configuration dictionary of the TV device being controlled.
         """
-        self.logger = logging.getLogger(__name__)
 
         # Load the necessary device configuration from the provided dictionary
+        self.device_config = device_config
         self.tv_ip_address = device_config.get('ip_address')
         self.client_id = device_config.get('client_id')
         self.nick_name = device_config.get('nick_name')
@@ -26,64 +78,258 @@ class TVService:
         self.psk = device_config.get('preshared_key')
         self.device_id = device_config.get('device_id', None)
         self.object_id = device_config.get('object_id', None)
-        self.tv = None
+
+        # Authenticated client shared by back-to-back intents (see connect_to_tv)
+        self._client = None
+        self._client_lock = asyncio.Lock()
+        self._idle_handle = None
+        self._last_used = 0.0
+        self._in_flight = {}  # Requests running per client; a client is only disconnected at 0
+        self._connect_backoff = 0.0  # Current wait after a failed connect, 0 after a success
+        self._next_connect_at = 0.0  # Loop time before which no new connect is attempted
 
         # Ensure either device_id or object_id exists
         if not self.device_id and not self.object_id:
             raise ValueError("Either 'device_id' or 'object_id' must be specified in the device configuration.")
 
+    @classmethod
+    def for_device(cls, device_config: dict) -> "TVService":
+        """
+        Return the TVService for a device, creating it on first use.
+
+        The instance is rebuilt if the device's configuration dictionary has been
+        replaced (e.g., after the plugin reloaded config.json).
+
+        Args:
+            device_config (dict): The configuration dictionary of the TV device being controlled.
+
+        Returns:
+            TVService: The service for the device.
+        """
+        key = canonical_id(device_config)
+        service = cls._instances.get(key)
+        if service is None or service.device_config is not device_config:
+            if service is not None:
+                # The replaced instance is unreachable from now on; release its client and timer
+                service._close_in_background()
+            service = cls(device_config)
+            cls._instances[key] = service
+        return service
+
+    @classmethod
+    async def aclose(cls):
+        """
+        Disconnect the pooled clients of every TVService. Intended for plugin shutdown.
+        """
+        for service in list(cls._instances.values()):
+            await service.close_client()
+        if cls._closing:
+            await asyncio.gather(*cls._closing, return_exceptions=True)
+
     async def connect_to_tv(self):
         """
-        Asynchronously connect to the Sony Bravia TV using the configured credentials.
+        Asynchronously return a connected client for the Sony Bravia TV.
+
+        The client is connected with the configured credentials on first use and
+        then reused until it has been idle for CLIENT_IDLE_TTL seconds, so a burst
+        of intents pays for a single connect. After a failed connect no new attempt
+        is made for a jittered, exponentially growing backoff (CONNECT_BACKOFF_MIN
+        up to CONNECT_BACKOFF_MAX); calls in that window return None immediately.
 
         Returns:
             BraviaClient: An instance of BraviaClient if the connection is successful.
             None: If the connection fails.
         """
+        loop = asyncio.get_running_loop()
+        client = self._client
+        if client is None:
+            # Only the first caller connects; the others wait and reuse its client
+            async with self._client_lock:
+                if self._client is None:
+                    # Don't hammer an unreachable TV: fail fast until the backoff expires
+                    if loop.time() < self._next_connect_at:
+                        return None
+                    client = BraviaClient(self.tv_ip_address)
+                    try:
+                        if self.pin:
+                            await client.connect(
+                                pin=self.pin, clientid=self.client_id, nickname=self.nick_name
+                            )
+                        else:
+                            await client.connect(psk=self.psk)
+                    except BraviaError as e:
+                        self._connect_backoff = min(
+                            max(self._connect_backoff * 2, self.CONNECT_BACKOFF_MIN),
+                            self.CONNECT_BACKOFF_MAX,
+                        )
+                        self._next_connect_at = loop.time() + self._connect_backoff + random.uniform(
+                            0, self._connect_backoff / 4
+                        )
+                        logger.error(
+                            "Failed to connect to TV: %s (next attempt in %.1fs)",
+                            e,
+                            self._connect_backoff,
+                        )
+                        await client.disconnect()
+                        return None
+                    self._connect_backoff = 0.0
+                    self._client = client
+                client = self._client
+
+        self._last_used = loop.time()
+        if self._idle_handle is None:
+            self._idle_handle = loop.call_later(self.CLIENT_IDLE_TTL, self._on_client_idle)
+        return client
+
+    def _on_client_idle(self):
+        """
+        Timer callback that disconnects the client once it has gone unused.
+
+        Uses within the TTL only move _last_used forward, so the timer is re-armed
+        for the remaining time instead of being rescheduled on every call.
+        """
+        loop = asyncio.get_running_loop()
+        remaining = self._last_used + self.CLIENT_IDLE_TTL - loop.time()
+        if remaining > 0:
+            self._idle_handle = loop.call_later(remaining, self._on_client_idle)
+            return
+        self._idle_handle = None
+        self._close_in_background()
+
+    def _close_in_background(self):
+        """
+        Run close_client as a task from synchronous code. The task is kept in
+        _closing until it finishes, and a failure is logged.
+        """
+        task = asyncio.get_running_loop().create_task(self.close_client())
+        self._closing.add(task)
+        task.add_done_callback(self._on_close_done)
+
+    def _on_close_done(self, task):
+        """Done callback of a background close_client task."""
+        self._closing.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Failed to disconnect from TV: %s", task.exception())
+
+    async def close_client(self):
+        """
+        Asynchronously disconnect the pooled client, if any.
+
+        Called when the client has been idle and on shutdown. The next intent
+        reconnects. If requests are still running on the client, the last of them
+        disconnects it when it finishes (see _call).
+        """
+        async with self._client_lock:
+            client = self._detach_client()
+        if client is not None and not self._in_flight.get(client):
+            await client.disconnect()
+
+    def _detach_client(self):
+        """Remove the pooled client and its idle timer, returning the client."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        client, self._client = self._client, None
+        return client
+
+    async def _call(self, operation, error_message: str, *error_args):
+        """
+        Asynchronously run one request against the TV on the pooled client.
+
+        A BraviaError is logged and drops the client, since its session may no
+        longer be usable; the next request reconnects. The client is only dropped
+        if it is still the pooled one, and it is disconnected once no other
+        request is running on it.
+
+        Args:
+            operation (callable): Takes the BraviaClient and returns the awaitable request.
+            error_message (str): %-style message logged on BraviaError; the error fills the last placeholder.
+            *error_args: Values for the placeholders before the error.
+
+        Returns:
+            The request's result, or _FAILED if the TV is not connected or the request failed.
+        """
+        client = await self.connect_to_tv()
+        if client is None:
+            logger.error("TV is not connected.")
+            return _FAILED
+        in_flight = self._in_flight
+        in_flight[client] = in_flight.get(client, 0) + 1
         try:
-            client = BraviaClient(self.tv_ip_address)
-            if self.pin:
-                await client.connect(
-                    pin=self.pin, clientid=self.client_id, nickname=self.nick_name
-                )
-            else:
-                await client.connect(psk=self.psk)
-            return client
+            return await operation(client)
         except BraviaError as e:
-            self.logger.error("Failed to connect to TV: %s", e)
-            return None
+            logger.error(error_message, *error_args, e)
+            async with self._client_lock:
+                if self._client is client:
+                    self._detach_client()
+            return _FAILED
+        finally:
+            in_flight[client] -= 1
+            if not in_flight[client]:
+                del in_flight[client]
+                # Disconnect a client that was dropped while this request was running
+                if client is not self._client:
+                    await client.disconnect()
+
+    async def execute_batch(self, ops: list) -> list:
+        """
+        Asynchronously run several control methods against the TV concurrently.
+
+        The pooled client is connected once up front and shared by every operation,
+        so a batch costs one connect plus N concurrent requests. Operations run in no
+        particular order; use separate calls when one must finish before the next.
+        A failing operation does not close the client under the others (see _call).
+
+        Args:
+            ops (list): (operation name, args tuple) pairs, e.g. [("set_volume", ("20",)), ("unmute", ())].
+                Names must be in BATCH_OPS.
+
+        Returns:
+            list: For each operation, in the order given, True if it succeeded and
+                False if it failed or the TV could not be reached.
+
+        Raises:
+            ValueError: If an operation is not in BATCH_OPS.
+        """
+        for name, _ in ops:
+            if name not in self.BATCH_OPS:
+                raise ValueError(f"Unsupported batch operation: {name}")
+
+        if await self.connect_to_tv() is None:
+            logger.error("TV is not connected.")
+            return [False] * len(ops)
+
+        results = await asyncio.gather(
+            *(getattr(self, name)(*args) for name, args in ops), return_exceptions=True
+        )
+        for (name, _), result in zip(ops, results):
+            if isinstance(result, Exception):
+                logger.error("Batched operation %s failed: %s", name, result)
+        return [result is True for result in results]
 
     async def turn_on(self):
         """
         Asynchronously turn on the TV.
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                await client.turn_on()
-                self.logger.info("TV turned on successfully.")
-            except BraviaError as e:
-                self.logger.error("Failed to turn on TV: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        if await self._call(
+            lambda client: client.turn_on(),
+            "Failed to turn on TV: %s",
+        ) is _FAILED:
+            return False
+        logger.info("TV turned on successfully.")
+        return True
 
     async def turn_off(self):
         """
         Asynchronously turn off the TV.
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                await client.turn_off()
-                self.logger.info("TV turned off successfully.")
-            except BraviaError as e:
-                self.logger.error("Failed to turn off TV: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        if await self._call(
+            lambda client: client.turn_off(),
+            "Failed to turn off TV: %s",
+        ) is _FAILED:
+            return False
+        logger.info("TV turned off successfully.")
+        return True
 
     async def set_volume(self, level: str):
         """
@@ -92,17 +338,13 @@ class TVService:
         Args:
             level (str): The volume level to set (e.g., '10', '+1', '-1').
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                await client.volume_level(level)
-                self.logger.info("TV volume set to %s.", level)
-            except BraviaError as e:
-                self.logger.error("Failed to set TV volume: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        if await self._call(
+            lambda client: client.volume_level(level),
+            "Failed to set TV volume to %s: %s", level,
+        ) is _FAILED:
+            return False
+        logger.info("TV volume set to %s.", level)
+        return True
 
     async def volume_up(self, step: int = 1):
         """
@@ -112,7 +354,7 @@ class TVService:
             step (int): The number of volume steps to increase (default is 1).
         """
         level = f"+{step}"
-        await self.set_volume(level)
+        return await self.set_volume(level)
 
     async def volume_down(self, step: int = 1):
         """
@@ -122,39 +364,31 @@ class TVService:
             step (int): The number of volume steps to decrease (default is 1).
         """
         level = f"-{step}"
-        await self.set_volume(level)
+        return await self.set_volume(level)
 
     async def mute(self):
         """
         Asynchronously mute the TV.
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                await client.volume_mute(True)
-                self.logger.info("TV muted successfully.")
-            except BraviaError as e:
-                self.logger.error("Failed to mute TV: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        if await self._call(
+            lambda client: client.volume_mute(True),
+            "Failed to mute TV: %s",
+        ) is _FAILED:
+            return False
+        logger.info("TV muted successfully.")
+        return True
 
     async def unmute(self):
         """
         Asynchronously unmute the TV.
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                await client.volume_mute(False)
-                self.logger.info("TV unmuted successfully.")
-            except BraviaError as e:
-                self.logger.error("Failed to unmute TV: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        if await self._call(
+            lambda client: client.volume_mute(False),
+            "Failed to unmute TV: %s",
+        ) is _FAILED:
+            return False
+        logger.info("TV unmuted successfully.")
+        return True
 
    # Playback Control Methods
 
@@ -162,138 +396,69 @@ class TVService:
         """
         Asynchronously start or resume playback on the TV.
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                await client.play()
-                self.logger.info("Playback started/resumed successfully.")
-            except BraviaError as e:
-                self.logger.error("Failed to start/resume playback: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        if await self._call(
+            lambda client: client.play(),
+            "Failed to start/resume playback: %s",
+        ) is _FAILED:
+            return False
+        logger.info("Playback started/resumed successfully.")
+        return True
 
     async def pause(self):
         """
         Asynchronously pause playback on the TV.
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                await client.pause()
-                self.logger.info("Playback paused successfully.")
-            except BraviaError as e:
-                self.logger.error("Failed to pause playback: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        if await self._call(
+            lambda client: client.pause(),
+            "Failed to pause playback: %s",
+        ) is _FAILED:
+            return False
+        logger.info("Playback paused successfully.")
+        return True
 
     async def stop(self):
         """
         Asynchronously stop playback on the TV.
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                await client.stop()
-                self.logger.info("Playback stopped successfully.")
-            except BraviaError as e:
-                self.logger.error("Failed to stop playback: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
-
-    async def rewind(self):
-        """
-        Asynchronously rewind playback on the TV.
-        """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                # await client.rewind()
-                self.logger.info("Playback rewound successfully.")
-            except BraviaError as e:
-                self.logger.error("Failed to rewind playback: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
-
-    async def fast_forward(self):
-        """
-        Asynchronously fast forward playback on the TV.
-        """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                # await client.fast_forward()
-                self.logger.info("Playback fast forwarded successfully.")
-            except BraviaError as e:
-                self.logger.error("Failed to fast forward playback: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
-
-    async def start_over(self):
-        """
-        Asynchronously start playback from the beginning on the TV.
-        """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                # await client.start_over()
-                self.logger.info("Playback started over successfully.")
-            except BraviaError as e:
-                self.logger.error("Failed to start playback over: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        if await self._call(
+            lambda client: client.stop(),
+            "Failed to stop playback: %s",
+        ) is _FAILED:
+            return False
+        logger.info("Playback stopped successfully.")
+        return True
 
     async def previous(self):
         """
         Asynchronously skip to the previous item on the TV.
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                await client.previous_track()
-                self.logger.info("Skipped to previous item successfully.")
-            except BraviaError as e:
-                self.logger.error("Failed to skip to previous item: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        if await self._call(
+            lambda client: client.previous_track(),
+            "Failed to skip to previous item: %s",
+        ) is _FAILED:
+            return False
+        logger.info("Skipped to previous item successfully.")
+        return True
 
     async def next(self):
         """
         Asynchronously skip to the next item on the TV.
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                await client.next_track()
-                self.logger.info("Skipped to next item successfully.")
-            except BraviaError as e:
-                self.logger.error("Failed to skip to next item: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        if await self._call(
+            lambda client: client.next_track(),
+            "Failed to skip to next item: %s",
+        ) is _FAILED:
+            return False
+        logger.info("Skipped to next item successfully.")
+        return True
 
     async def get_app_list(self):
         """
         Asynchronously retrieve the list of available applications from the TV.
 
-        This method connects to the Sony Bravia TV using the BraviaClient, retrieves
-        the list of available applications installed on the TV, and then disconnects
-        from the TV. If the connection to the TV fails or retrieving the app list
-        encounters an error, appropriate logging is performed.
+        This method uses the device's pooled BraviaClient to retrieve the list of
+        available applications installed on the TV. If the connection to the TV fails
+        or retrieving the app list encounters an error, appropriate logging is performed.
 
         Returns:
             list: A list of dictionaries, where each dictionary contains information
@@ -311,16 +476,11 @@ class TVService:
             else:
                 print("Failed to retrieve the app list.")
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                return await client.get_app_list()
-            except BraviaError as e:
-                self.logger.error("Failed to get the application list: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        apps = await self._call(
+            lambda client: client.get_app_list(),
+            "Failed to get the application list: %s",
+        )
+        return None if apps is _FAILED else apps
 
     async def launch_app(self, app_name):
         """
@@ -329,26 +489,21 @@ class TVService:
         Args:
             app_name (str): The name of the app to launch.
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                await client.set_active_app(app_name)
-                self.logger.info("App '%s' launched successfully.", app_name)
-            except BraviaError as e:
-                self.logger.error("Failed to launch app '%s': %s", app_name, e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        if await self._call(
+            lambda client: client.set_active_app(app_name),
+            "Failed to launch app '%s': %s", app_name,
+        ) is _FAILED:
+            return False
+        logger.info("App '%s' launched successfully.", app_name)
+        return True
 
     async def get_source_list(self, scheme="extInput"):
         """
         Asynchronously retrieve the list of available input sources from the TV.
 
-        This method connects to the Sony Bravia TV using the BraviaClient, retrieves
-        the list of available input sources, and then disconnects from the TV. If the
-        connection to the TV fails or retrieving the source list encounters an error,
-        appropriate logging is performed.
+        This method uses the device's pooled BraviaClient to retrieve the list of
+        available input sources. If the connection to the TV fails or retrieving the
+        source list encounters an error, appropriate logging is performed.
 
         Returns:
             list: A list of dictionaries, where each dictionary contains information
@@ -367,16 +522,11 @@ class TVService:
             else:
                 print("Failed to retrieve the source list.")
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                return await client.get_source_list(scheme=scheme)
-            except BraviaError as e:
-                self.logger.error("Failed to get the source list: %s", e)
-            finally:
-                await client.disconnect()
-        else:
-            self.logger.error("TV is not connected.")
+        sources = await self._call(
+            lambda client: client.get_source_list(scheme=scheme),
+            "Failed to get the source list: %s",
+        )
+        return None if sources is _FAILED else sources
 
     async def change_input(self, input_source):
         """
@@ -385,40 +535,36 @@ class TVService:
         Args:
             input_source (str): The input source to switch to (e.g., 'HDMI 2').
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                if await client.send_command(input_source):
-                    self.logger.info(
-                        "Input source changed to '%s' successfully.", input_source
-                    )
-                else:
-                    self.logger.error(
-                        "Failed to change input source to '%s'.", input_source
-                    )
-            except BraviaError as e:
-                self.logger.error(
-                    "Failed to change input source to '%s': %s", input_source, e
-                )
-            finally:
-                await client.disconnect()
+        sent = await self._call(
+            lambda client: client.send_command(input_source),
+            "Failed to change input source to '%s': %s", input_source,
+        )
+        if sent is _FAILED:
+            return False
+        if sent:
+            logger.info("Input source changed to '%s' successfully.", input_source)
         else:
-            self.logger.error("TV is not connected.")
+            logger.error("Failed to change input source to '%s'.", input_source)
+        return bool(sent)
 
-    def write_dict_to_file(self, data, file_path):
+    async def write_dict_to_file(self, data, file_path):
         """
-        Write a Python dictionary to a file using UTF-8 encoding.
+        Asynchronously write a Python dictionary to a file using UTF-8 encoding.
+
+        The data is serialized on the event loop, but the disk write runs in a worker
+        thread. It goes to a temporary file that then replaces the target, so readers
+        never see a partially written file.
 
         Args:
             data (dict): The dictionary to write to the file.
             file_path (str): The path to the file where the dictionary will be written.
         """
         try:
-            with open(file_path, "w", encoding="utf-8") as file:
-                json.dump(data, file, ensure_ascii=False, indent=4)
-            print(f"Dictionary successfully written to {file_path}")
+            payload = json.dumps(data, ensure_ascii=False, indent=4).encode("utf-8")
+            await asyncio.to_thread(_atomic_write, file_path, payload)
+            logger.info("Dictionary successfully written to %s", file_path)
         except Exception as e:
-            print(f"Error writing dictionary to file: {e}")
+            logger.error("Error writing dictionary to file: %s", e)
 
     async def goto(self, where):
         """
@@ -427,16 +573,14 @@ class TVService:
         Args:
             app_name (str): The name of the app to launch.
         """
-        client = await self.connect_to_tv()
-        if client:
-            try:
-                if await client.send_command(where):
-                    self.logger.info("Goto where '%s' successfully.", where)
-                else:
-                    self.logger.error("Failed to change input source to '%s'.", where)
-            except BraviaError as e:
-                self.logger.error("Failed to goto '%s': %s", where, e)
-            finally:
-                await client.disconnect()
+        sent = await self._call(
+            lambda client: client.send_command(where),
+            "Failed to goto '%s': %s", where,
+        )
+        if sent is _FAILED:
+            return False
+        if sent:
+            logger.info("Goto where '%s' successfully.", where)
         else:
-            self.logger.error("TV is not connected.")
+            logger.error("Failed to change input source to '%s'.", where)
+        return bool(sent)
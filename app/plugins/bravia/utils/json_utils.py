@@ -1,12 +1,39 @@
-import json
+import logging
+import os
+
+import orjson
+
+logger = logging.getLogger(__name__)
 
 
 class JsonUtils:
+    # Parsed JSON files by absolute path, shared by all callers in the process
+    _cache = {}
+
     @staticmethod
     def load_json_file(file_path):
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                return json.load(file)
+            with open(file_path, "rb") as file:
+                return orjson.loads(file.read())
         except Exception as e:
-            print(f"Error loading JSON file {file_path}: {e}")
+            logger.error("Error loading JSON file %s: %s", file_path, e)
             return None
+
+    @classmethod
+    def load_cached_json_file(cls, file_path):
+        """
+        Load a JSON file once per process and return the parsed data on later calls.
+
+        Failed loads are not cached, so a missing or broken file is retried next time.
+        The returned data is shared between callers and must not be modified.
+
+        :param file_path: Path to the JSON file.
+        :return: The parsed JSON data, or None if the file could not be loaded.
+        """
+        key = os.path.abspath(file_path)
+        data = cls._cache.get(key)
+        if data is None:
+            data = cls.load_json_file(file_path)
+            if data is not None:
+                cls._cache[key] = data
+        return data
@@ -1,5 +1,9 @@
+import logging
+
 from .json_utils import JsonUtils
 
+logger = logging.getLogger(__name__)
+
 class TVAppMapper:
     def __init__(self):
         """
@@ -8,6 +12,8 @@ class TVAppMapper:
         self.tv_apps = {}  # Maps TV app names to their URIs
         self.alexa_to_tv_mapping = {}  # Maps Alexa app identifiers to TV app URIs
         self.alexa_name_to_identifier = {}  # Maps Alexa app names to their identifiers
+        self._alexa_app_names = {}  # Maps Alexa app identifiers to lowercased app names, as loaded
+        self._combined = {}  # Maps Alexa identifiers and lowercased names straight to TV app URIs
 
     def set_tv_apps(self, apps_list):
         """
@@ -26,27 +32,42 @@ class TVAppMapper:
 
         :param file_path: Path to the JSON file containing Alexa app data.
         """
-        data = JsonUtils.load_json_file(file_path)  # Use JsonUtils for file loading
+        data = JsonUtils.load_cached_json_file(file_path)  # Parsed once per process by JsonUtils
 
         if data:
             # Create mappings from Alexa data with case-insensitive keys
-            self.alexa_to_tv_mapping = {
+            self._alexa_app_names = {
                 app["identifier"]: app["name"].lower() for app in data.get("apps", [])
             }
             self.alexa_name_to_identifier = {
                 app["name"].lower(): app["identifier"] for app in data.get("apps", [])
             }
+            self.build_alexa_to_tv_mapping()
         else:
-            print(f"Error loading Alexa apps from {file_path}")
+            logger.error("Error loading Alexa apps from %s", file_path)
 
     def build_alexa_to_tv_mapping(self):
         """
         Build the mapping from Alexa identifiers to TV app URIs.
+
+        Apps the TV does not have keep their lowercased Alexa name (e.g. '__home__' style
+        commands). The mapping is rebuilt from the loaded Alexa names each time, so a
+        later app list resolves against the original names rather than earlier URIs.
         """
-        # Rebuild the mapping for case-insensitivity
-        for alexa_identifier, app_name in self.alexa_to_tv_mapping.items():
-            if app_name in self.tv_apps:
-                self.alexa_to_tv_mapping[alexa_identifier] = self.tv_apps[app_name]
+        tv_apps = self.tv_apps
+        self.alexa_to_tv_mapping = {
+            alexa_identifier: tv_apps.get(app_name, app_name)
+            for alexa_identifier, app_name in self._alexa_app_names.items()
+        }
+        # Let names resolve in one lookup too, skipping the name -> identifier hop
+        self._combined = {
+            **self.alexa_to_tv_mapping,
+            **{
+                app_name: self.alexa_to_tv_mapping[alexa_identifier]
+                for app_name, alexa_identifier in self.alexa_name_to_identifier.items()
+                if alexa_identifier in self.alexa_to_tv_mapping
+            },
+        }
 
     def get_tv_app_uri_by_name_or_identifier(self, identifier_or_name):
         """
@@ -55,17 +76,10 @@ class TVAppMapper:
         :param identifier_or_name: The app identifier or app name used by Alexa.
         :return: The TV app URI or None if not found.
         """
-        # Try to get the app URI by identifier
-        app_uri = self.get_tv_app_identifier(identifier_or_name)
-        if app_uri:
-            return app_uri
-
-        # If identifier_or_name is actually an app name, get the identifier first
-        alexa_identifier = self.get_alexa_identifier(identifier_or_name)
-        if alexa_identifier:
-            return self.get_tv_app_identifier(alexa_identifier)
-
-        return None
+        # Identifiers match as given, app names case-insensitively
+        return self._combined.get(identifier_or_name) or self._combined.get(
+            identifier_or_name.lower()
+        )
 
     def get_tv_app_identifier(self, alexa_identifier):
         """
@@ -83,4 +97,7 @@ class TVAppMapper:
         :param alexa_app_name: The app name used by Alexa.
         :return: The app identifier string for Alexa, or None if not found.
         """
-        return self.alexa_name_to_identifier.get(alexa_app_name.lower())
+        # Names are stored lowercased; only convert when the raw name misses
+        return self.alexa_name_to_identifier.get(alexa_app_name) or self.alexa_name_to_identifier.get(
+            alexa_app_name.lower()
+        )
@@ -1,4 +1,5 @@
 import logging
+import sys
 from typing import Dict, Optional
 from .json_utils import JsonUtils
 
@@ -21,15 +22,21 @@ class TVInputMapper:
         """
         Load input mappings from the JSON configuration file specified by the provided file path.
 
+        Keys are upper-cased here so lookups of already normalized inputs need no
+        conversion, and the command names are interned since they are handed out repeatedly.
+
         Returns:
             dict: A dictionary containing the Alexa to TV input mappings.
                   Returns an empty dictionary if the file cannot be loaded.
         """
-        data = JsonUtils.load_json_file(input_mappings_file_path)  # Use JsonUtils for file loading
+        data = JsonUtils.load_cached_json_file(input_mappings_file_path)  # Parsed once per process by JsonUtils
 
         if data:
             self.logger.info("Input mappings loaded successfully.")
-            return data.get("input_mappings", {})
+            return {
+                alexa_input.upper(): sys.intern(tv_input)
+                for alexa_input, tv_input in data.get("input_mappings", {}).items()
+            }
         else:
             self.logger.error(f"Failed to load input mappings from {input_mappings_file_path}")
             return {}
@@ -49,7 +56,10 @@ class TVInputMapper:
             self.logger.warning("No Alexa input provided.")
             return None
 
-        tv_input_command = self.input_mappings.get(alexa_input.upper())
+        # Alexa usually sends the upper-case form already; only convert on a miss
+        tv_input_command = self.input_mappings.get(alexa_input) or self.input_mappings.get(
+            alexa_input.upper()
+        )
         if tv_input_command:
             self.logger.info(
                 "Mapped Alexa input '%s' to TV input command '%s'.",
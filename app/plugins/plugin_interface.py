@@ -31,16 +31,28 @@ class IotPlugin(ABC):
         pass
 
     @abstractmethod
-    async def process_message(self, topic: str, payload: str):
+    async def process_message(self, topic: str, payload: bytes):
         """
         Processes the message received for the plugin.
 
         Parameters:
         - topic (str): The MQTT topic the message was received on.
-        - payload (str): The message payload received on the topic.
+        - payload (bytes): The raw message payload received on the topic.
         """
         pass
 
+    async def process_messages(self, messages: list):
+        """
+        Processes a batch of messages received for the plugin, in arrival order.
+        Plugins can override this to handle several messages at once; by default
+        each message is passed to `process_message`.
+
+        Parameters:
+        - messages (list): A list of (topic, payload) tuples.
+        """
+        for topic, payload in messages:
+            await self.process_message(topic, payload)
+
     @abstractmethod
     async def shutdown(self):
         """
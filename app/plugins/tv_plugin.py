@@ -1,8 +1,14 @@
-import json
 import logging
+
+import orjson
+
 from app.plugins.plugin_interface import IotPlugin
 
 class TVPlugin(IotPlugin):
+    # Topic filters and the matching literal prefixes, built once for every lookup
+    _TOPICS = ["domus/devices/tv/#"]
+    _TOPIC_PREFIXES = ("domus/devices/tv/",)
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
@@ -18,23 +24,24 @@ class TVPlugin(IotPlugin):
         Determine if this plugin can handle the given topic.
         We assume TV-related topics follow a pattern like 'domus/devices/tv/#'
         """
-        #return "domus/devices/tv/" in topic
+        # Disabled: the Bravia plugin handles these topics
+        #return topic.startswith(self._TOPIC_PREFIXES)
         return False
 
     def get_topics(self) -> list:
         """
         Return the list of topics that this plugin handles.
         """
-        return ["domus/devices/tv/#"]
+        return self._TOPICS
 
-    async def process_message(self, topic: str, payload: str):
+    async def process_message(self, topic: str, payload: bytes):
         """
-        Processes TV-related messages. The payload is expected to be a JSON string 
+        Processes TV-related messages. The payload is expected to be a JSON document 
         with a power state like {"powerState": "ON"} or {"powerState": "OFF"}.
         """
         try:
             # Parse the JSON payload
-            data = json.loads(payload)
+            data = orjson.loads(payload)
             power_state = data.get("powerState")
 
             if power_state == "ON":
@@ -46,7 +53,7 @@ class TVPlugin(IotPlugin):
             else:
                 self.logger.warning("Unrecognized power state: %s", power_state)
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             self.logger.error("Failed to decode TV message payload: %s", payload)
 
 
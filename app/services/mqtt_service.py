@@ -1,11 +1,30 @@
 import asyncio
 import logging
 
+import orjson
 import paho.mqtt.client as mqtt
 from app.config.config import Config
+from app.utils.message_inbox import MessageInbox
 
         
 class MqttService:
+    # Fixed attribute set; avoids a per-instance __dict__
+    __slots__ = (
+        "logger", "client_id", "broker", "port", "topic", "client",
+        "_misc_handle", "inbox", "_consumer_task", "_heartbeat_handle",
+        "_reconnect_future", "loop", "connected_event",
+        "_is_connected", "_initial_connection_attempt", "heartbeat_interval",
+    )
+
+    # Upper bound on received messages waiting for processing; further messages are dropped
+    MAX_QUEUED_MESSAGES = 1024
+    # Most queued messages handed to process_messages in one call
+    MAX_BATCH_SIZE = 100
+    # Most process_messages calls running at the same time
+    MAX_CONCURRENT_BATCHES = 8
+    # Log a warning for the first dropped message and then once per this many drops
+    DROP_LOG_INTERVAL = 100
+
     def __init__(self, heartbeat_interval: int = 10, client_id = None):
         """
         Initialize the MQTT service with a heartbeat interval for connection checks.
@@ -27,23 +46,111 @@ class MqttService:
         self.client.on_message = self.on_message  # Set the on_message callback
         self.client.on_disconnect = self.on_disconnect
 
-        # Event loop and connection status
+        # Drive the client's network I/O from the asyncio event loop instead of a paho thread
+        self.client.on_socket_open = self.on_socket_open
+        self.client.on_socket_close = self.on_socket_close
+        self.client.on_socket_register_write = self.on_socket_register_write
+        self.client.on_socket_unregister_write = self.on_socket_unregister_write
+        self._misc_handle = None  # Pending loop_misc timer (see _misc_tick)
+
+        # Received messages, drained by a single consumer task that runs each batch in its own task
+        self.inbox = MessageInbox(
+            self.MAX_QUEUED_MESSAGES,
+            self.MAX_BATCH_SIZE,
+            self.DROP_LOG_INTERVAL,
+            self.MAX_CONCURRENT_BATCHES,
+        )
+        self._consumer_task = None  # Started by the first on_message call
+        self._heartbeat_handle = None  # Pending heartbeat timer (see start_heartbeat)
+        self._reconnect_future = None  # Connect/reconnect running in a worker thread
+
+        # Event loop driving the client; bound on connect if not constructed inside one
         try:
             self.loop = asyncio.get_running_loop()
         except RuntimeError:
-            self.loop = asyncio.get_event_loop()
+            self.loop = None
+
+        # Connection status
 
         self.connected_event = asyncio.Event()
         self._is_connected = False  # Track connection status
         self._initial_connection_attempt = False  # Track if we've tried the initial connection
         self.heartbeat_interval = heartbeat_interval  # Heartbeat check interval in seconds
 
+    def _use_running_loop(self) -> None:
+        """Attach the client's network I/O to the running event loop, if there is one."""
+        try:
+            self.loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+
+    def _call_in_loop(self, callback, *args) -> None:
+        """Run a callback on the event loop thread, directly if already on it."""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if self.loop is None:
+            raise RuntimeError("MqttService must be connected from within a running event loop")
+        elif running_loop is self.loop:
+            callback(*args)
+        else:
+            self.loop.call_soon_threadsafe(callback, *args)
+
+    def on_socket_open(self, client, userdata, sock) -> None:
+        """Callback when the client opens its socket: watch it for incoming data."""
+        self._call_in_loop(self._watch_socket, sock.fileno())
+
+    def on_socket_close(self, client, userdata, sock) -> None:
+        """Callback when the client closes its socket: stop watching it."""
+        self._call_in_loop(self._unwatch_socket, sock.fileno())
+
+    def on_socket_register_write(self, client, userdata, sock) -> None:
+        """Callback when the client has outgoing data: write it once the socket is ready."""
+        self._call_in_loop(self._watch_write, sock.fileno())
+
+    def on_socket_unregister_write(self, client, userdata, sock) -> None:
+        """Callback when the client has no more outgoing data."""
+        self._call_in_loop(self._unwatch_write, sock.fileno())
+
+    # The socket callbacks hand these methods to _call_in_loop instead of bound loop
+    # methods, so an unbound loop raises its RuntimeError rather than an AttributeError
+
+    def _watch_socket(self, fd: int) -> None:
+        """Read from the socket when it becomes readable and start the housekeeping task."""
+        self.loop.add_reader(fd, self.client.loop_read)
+        if self._misc_handle is None:
+            self._misc_handle = self.loop.call_later(1, self._misc_tick)
+
+    def _unwatch_socket(self, fd: int) -> None:
+        """Stop reading from the closed socket."""
+        self.loop.remove_reader(fd)
+
+    def _watch_write(self, fd: int) -> None:
+        """Write the client's outgoing data when the socket becomes writable."""
+        self.loop.add_writer(fd, self.client.loop_write)
+
+    def _unwatch_write(self, fd: int) -> None:
+        """Stop waiting for the socket to become writable."""
+        self.loop.remove_writer(fd)
+
+    def _misc_tick(self) -> None:
+        """
+        Timer callback running the client's periodic housekeeping (keepalive pings, retries)
+        once a second while its socket is open.
+        """
+        if self.client.loop_misc() == mqtt.MQTT_ERR_SUCCESS:
+            self._misc_handle = self.loop.call_later(1, self._misc_tick)
+        else:
+            self._misc_handle = None
+
     def connect(self) -> None:
         """Synchronous connect method."""
         self.logger.info("Connecting to MQTT broker synchronously.")
+        self._use_running_loop()
         try:
             self.client.connect(self.broker, self.port)
-            self.client.loop_start()
             self.logger.info("Synchronous connection attempt made.")
         except Exception as e:
             self.logger.error("Synchronous connection failed: %s", e)
@@ -51,11 +158,11 @@ class MqttService:
     async def async_connect(self) -> None:
         """Asynchronous method to connect to the MQTT broker."""
         self.logger.info("Asynchronously connecting to MQTT broker...")
+        self._use_running_loop()
 
         try:
             # Use asyncio.to_thread to run the connect method in a non-blocking manner
             await asyncio.to_thread(self.client.connect, self.broker, self.port)
-            self.client.loop_start()  # Start the MQTT client loop after connecting
             self.logger.info("Asynchronous connection attempt made. Waiting for broker confirmation...")
         except Exception as e:
             self.logger.error("Async connection failed: %s", e)
@@ -68,7 +175,7 @@ class MqttService:
             self.logger.info("Subscribed to topic: %s", self.topic)
             # Set the initial connection attempt flag to True after the first connection
             self._initial_connection_attempt = True            
-            asyncio.run_coroutine_threadsafe(self._set_connected_event(), self.loop)
+            self._call_in_loop(self._set_connected)
         else:
             self.logger.error("Failed to connect, return code %d", rc)
 
@@ -78,59 +185,108 @@ class MqttService:
         self._is_connected = False  # Set connection status to False
         self.connected_event.clear()  # Clear the connection event
         
+    @property
+    def dropped_messages(self) -> int:
+        """Number of messages discarded because the inbox was full."""
+        return self.inbox.dropped
+
     def on_message(self, client, userdata, message) -> None:
         """
         Callback when a message is received on a subscribed topic.
+        Runs on the event loop thread, as the client's socket is read from the loop.
         """
-        self.logger.info(
-            "Received message on %s: %s", message.topic, message.payload.decode("utf-8")
+        # The payload is decoded once, by process_message; only its size is logged here
+        self.logger.debug("Received message on %s (%d bytes)", message.topic, len(message.payload))
+        # Only started here, so no consumer waits on the inbox when another handler replaces on_message
+        if self._consumer_task is None:
+            self._consumer_task = self.loop.create_task(self.inbox.consume(self.process_messages))
+        self.inbox.put_nowait(message)
+
+    async def process_messages(self, messages: list) -> None:
+        """
+        Process a batch of received MQTT messages.
+        The default handles the messages concurrently with process_message, so a slow
+        message does not delay the others; override to process batches together.
+        """
+        results = await asyncio.gather(
+            *(self.process_message(message) for message in messages), return_exceptions=True
         )
-        asyncio.run_coroutine_threadsafe(self.process_message(message), self.loop)
+        for message, result in zip(messages, results):
+            if isinstance(result, Exception):
+                self.logger.error("Error processing message on %s: %s", message.topic, result)
 
     async def process_message(self, message) -> None:
         """
         Process the received MQTT message asynchronously.
-        This method can be customized to handle different types of message processing.
+        The default only logs the message; override to handle different types of message processing.
         """
-        self.logger.info("Processing message: %s", message.payload.decode("utf-8"))
-        await asyncio.sleep(1)  # Simulate async processing (replace with actual logic)
+        # The decode is an argument, so check the level first instead of paying for it regardless
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Processing message: %s", message.payload.decode("utf-8"))
 
-    async def _set_connected_event(self) -> None:
-        """Set the connection event when connected."""
+    def _set_connected(self) -> None:
+        """Set the connection event when connected. Must run on the event loop thread."""
         self._is_connected = True  # Mark as connected
         self.connected_event.set()
 
-    async def heartbeat(self) -> None:
+    def start_heartbeat(self) -> None:
+        """
+        Start checking the connection status every heartbeat_interval seconds,
+        attempting to connect/reconnect while disconnected. Must be called from the event loop.
+        """
+        self._use_running_loop()
+        if self._heartbeat_handle is None:
+            self._heartbeat_handle = self.loop.call_later(self.heartbeat_interval, self._heartbeat_tick)
+
+    def _heartbeat_tick(self) -> None:
         """
-        Heartbeat task to check the connection status and attempt reconnection if disconnected.
+        Timer callback for one heartbeat check. It re-arms itself, and runs the
+        blocking connect/reconnect in a worker thread so the event loop is never held up.
         """
-        while True:
-            if not self._is_connected:
-                self.logger.warning("MQTT client is not connected. Attempting to connect/reconnect...")
+        self._heartbeat_handle = self.loop.call_later(self.heartbeat_interval, self._heartbeat_tick)
 
-                try:
-                    # Check if the initial connection has never been made
-                    if not self._initial_connection_attempt:
-                        self.logger.info("Initial connection attempt failed. Trying to connect again...")
-                        self.connect()
-                    else:
-                        # If initial connection succeeded, attempt to reconnect
-                        self.logger.info("Attempting to reconnect...")
-                        self.client.reconnect()
+        if self._is_connected:
+            self.logger.info("MQTT client is healthy and connected.")
+            return
 
-                    self.logger.info("Connection/reconnection attempt made. Waiting for broker confirmation...")
-                except Exception as e:
-                    self.logger.error("Connection/reconnection failed: %s", e)
-            else:
-                self.logger.info("MQTT client is healthy and connected.")
+        self.logger.warning("MQTT client is not connected. Attempting to connect/reconnect...")
+        if self._reconnect_future is not None and not self._reconnect_future.done():
+            self.logger.info("Previous connection attempt still in progress.")
+            return
+
+        # Check if the initial connection has never been made
+        if not self._initial_connection_attempt:
+            self.logger.info("Initial connection attempt failed. Trying to connect again...")
+            attempt = self.connect
+        else:
+            # If initial connection succeeded, attempt to reconnect
+            self.logger.info("Attempting to reconnect...")
+            attempt = self.client.reconnect
+
+        self._reconnect_future = self.loop.run_in_executor(None, attempt)
+        self._reconnect_future.add_done_callback(self._on_reconnect_attempt_done)
 
-            # Wait for the specified heartbeat interval before the next check
-            await asyncio.sleep(self.heartbeat_interval)
-            
-    async def publish(self, topic: str, payload: dict) -> None:
-        """Publish a message to a topic."""
-        self.logger.info("Publishing message to topic %s", topic)
-        result = await asyncio.to_thread(self.client.publish, topic, payload)
+    def _on_reconnect_attempt_done(self, future) -> None:
+        """Log the outcome of a connect/reconnect attempt started by the heartbeat."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.logger.error("Connection/reconnection failed: %s", error)
+        else:
+            self.logger.info("Connection/reconnection attempt made. Waiting for broker confirmation...")
+
+    async def publish(self, topic: str, payload) -> None:
+        """
+        Publish a message to a topic.
+
+        :param payload: str or bytes are sent as-is; dicts and lists are serialized to JSON with orjson.
+        """
+        self.logger.debug("Publishing message to topic %s", topic)
+        if isinstance(payload, (dict, list)):
+            payload = orjson.dumps(payload)
+        # Non-blocking: paho queues the packet and the loop writes it when the socket is ready
+        result = self.client.publish(topic, payload)
 
         if result.rc == mqtt.MQTT_ERR_SUCCESS:
             self.logger.info("Message published to topic %s", topic)
@@ -155,7 +311,6 @@ class MqttService:
 
     async def disconnect(self) -> None:
         """Disconnect from the broker."""
-        self.client.loop_stop()
         self.client.disconnect()
         self.logger.info("Disconnected from MQTT broker.")
 
@@ -168,8 +323,18 @@ class MqttService:
             # If connected, call the disconnect method to properly disconnect
             await self.disconnect()
         
-        # Stop the MQTT client loop, forcefully if needed
-        self.client.loop_stop(force=True)
+        # Stop the heartbeat, the periodic housekeeping of the MQTT client and the message consumer
+        if self._heartbeat_handle:
+            self._heartbeat_handle.cancel()
+            self._heartbeat_handle = None
+        if self._misc_handle:
+            self._misc_handle.cancel()
+            self._misc_handle = None
+        if self._consumer_task:
+            self._consumer_task.cancel()
+            self._consumer_task = None
+        # Stop the message batches still being processed
+        await self.inbox.aclose()
         
         # Log that the service has been fully shut down
         self.logger.info("MQTT service shutdown complete.")
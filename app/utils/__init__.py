@@ -0,0 +1,5 @@
+# app/utils/__init__.py
+from .message_inbox import MessageInbox
+from .topic_trie import TopicTrie
+
+__all__ = ['MessageInbox', 'TopicTrie']
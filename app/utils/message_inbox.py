@@ -0,0 +1,112 @@
+import asyncio
+import functools
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class MessageInbox:
+    """
+    Bounded queue of received MQTT messages, drained in batches by a single consumer
+    that handles each batch in its own task.
+
+    Messages are queued from the client's on_message callback with `put_nowait`; when
+    the queue is full they are dropped and counted, and a warning is logged for the
+    first drop and then once per `drop_log_interval` drops. `consume` waits for the
+    next message, then takes every message already queued behind it (up to
+    `max_batch_size`), so a burst is handled in one call while an isolated message
+    is still handled without delay. Up to `max_concurrent_batches` batches are
+    handled at once, so one slow handler call (e.g. a request to a TV that is off)
+    does not hold up the messages queued behind it.
+    """
+    __slots__ = ("_queue", "_limit", "_tasks", "max_batch_size", "drop_log_interval", "dropped")
+
+    def __init__(
+        self,
+        maxsize: int,
+        max_batch_size: int,
+        drop_log_interval: int = 100,
+        max_concurrent_batches: int = 8,
+    ):
+        """
+        Parameters:
+        - maxsize (int): Upper bound on queued messages; further messages are dropped.
+        - max_batch_size (int): Most messages handed to the handler in one call.
+        - drop_log_interval (int): Log a warning once per this many dropped messages.
+        - max_concurrent_batches (int): Most handler calls running at the same time.
+        """
+        self._queue = asyncio.Queue(maxsize=maxsize)
+        self._limit = asyncio.Semaphore(max_concurrent_batches)
+        self._tasks = set()  # Running handler tasks, referenced until done
+        self.max_batch_size = max_batch_size
+        self.drop_log_interval = drop_log_interval
+        self.dropped = 0  # Messages discarded because the queue was full
+
+    def qsize(self) -> int:
+        """Return the number of queued messages."""
+        return self._queue.qsize()
+
+    def put_nowait(self, message) -> None:
+        """
+        Queue a message, dropping it if the queue is full. Must run on the event loop thread.
+
+        Parameters:
+        - message: The message received on the subscribed topic.
+        """
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped % self.drop_log_interval == 1:
+                logger.warning(
+                    "Message queue is full, dropping message on topic %s (%d dropped so far)",
+                    message.topic,
+                    self.dropped,
+                )
+
+    async def consume(self, handler) -> None:
+        """
+        Long-running task that hands the queued messages to handler in batches.
+
+        Each batch is handled in its own task. When max_concurrent_batches are
+        running, the next batch is taken once one of them finishes; messages keep
+        queuing (or are dropped) meanwhile.
+
+        Parameters:
+        - handler: Coroutine function taking the list of messages of one batch. An
+          exception it raises is logged and does not affect the other batches.
+        """
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._limit.acquire()
+            try:
+                batch = [await queue.get()]
+            except BaseException:
+                self._limit.release()
+                raise
+            while len(batch) < self.max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            task = loop.create_task(handler(batch))
+            self._tasks.add(task)
+            task.add_done_callback(functools.partial(self._on_batch_done, len(batch)))
+
+    def _on_batch_done(self, batch_size: int, task) -> None:
+        """Done callback of a handler task: free its slot and log its failure."""
+        self._tasks.discard(task)
+        self._limit.release()
+        for _ in range(batch_size):
+            self._queue.task_done()
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Error processing batch of %d messages: %s", batch_size, task.exception())
+
+    async def aclose(self) -> None:
+        """
+        Cancel the running handler tasks and wait for them to finish. Call after
+        cancelling the consume task.
+        """
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
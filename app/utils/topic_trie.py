@@ -0,0 +1,94 @@
+class _Node:
+    """
+    A single level of the topic trie.
+    """
+    __slots__ = ("children", "values")
+
+    def __init__(self):
+        self.children = {}
+        self.values = []
+
+
+class TopicTrie:
+    """
+    Index of MQTT topic filters for matching incoming topics against subscriptions.
+
+    Filters without wildcards are kept in a plain dictionary, so matching them is a
+    single lookup. Filters with the `+` (single level) and `#` (multi level) wildcards
+    are stored in a trie keyed by topic level, which is walked once per match.
+
+    For example:
+    - `domus/devices/tv/+/power/set` matches `domus/devices/tv/TV123/power/set`
+    - `domus/devices/#` matches `domus/devices`, `domus/devices/tv` and `domus/devices/tv/1/input`
+    """
+
+    def __init__(self):
+        self._exact = {}
+        self._root = _Node()
+
+    def insert(self, topic_filter: str, value) -> None:
+        """
+        Register a value for a topic filter.
+
+        Parameters:
+        - topic_filter (str): The MQTT topic filter (e.g., "domus/devices/tv/#").
+        - value: The value returned by `match` for topics matching the filter.
+        """
+        if "+" not in topic_filter and "#" not in topic_filter:
+            self._exact.setdefault(topic_filter, []).append(value)
+            return
+
+        node = self._root
+        for level in topic_filter.split("/"):
+            node = node.children.setdefault(level, _Node())
+        node.values.append(value)
+
+    def match(self, topic: str) -> list:
+        """
+        Return the values of all filters matching the given topic.
+
+        Parameters:
+        - topic (str): The topic of an incoming message (no wildcards).
+
+        Returns:
+        - list: The matching values, without duplicates.
+        """
+        matches = list(self._exact.get(topic, ()))
+        if not self._root.children:
+            return matches
+
+        levels = topic.split("/")
+        count = len(levels)
+        # Wildcards in the first level do not match topics starting with '$'
+        wildcards = not topic.startswith("$")
+        stack = [(self._root, 0)]
+
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+
+            # '#' matches the parent level and any number of remaining levels
+            multi = children.get("#")
+            if multi is not None and (wildcards or index > 0):
+                matches.extend(multi.values)
+
+            if index == count:
+                matches.extend(node.values)
+                continue
+
+            child = children.get(levels[index])
+            if child is not None:
+                stack.append((child, index + 1))
+
+            single = children.get("+")
+            if single is not None and (wildcards or index > 0):
+                stack.append((single, index + 1))
+
+        return list(dict.fromkeys(matches))
+
+    def clear(self) -> None:
+        """
+        Remove all registered filters.
+        """
+        self._exact.clear()
+        self._root = _Node()
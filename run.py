@@ -4,6 +4,11 @@ import logging
 from app import CommandLine
 from app.host.host import Host
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +25,9 @@ async def main_async():
 
 
 def main():
+    if uvloop is not None:
+        # Drive the Host (MQTT client and Uvicorn server) with the libuv based loop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main_async())
 
 
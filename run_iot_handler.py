@@ -1,9 +1,16 @@
 import asyncio
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from app.iot_handler.iot_handler import IotHandler
 from app.runtime.command_line import CommandLine
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,20 +22,44 @@ async def main_async():
         instance = IotHandler(args)
         # Run the async main function with the parsed arguments
         await instance.run_async()
-        pass
     except ValueError as e:
         logger.error("Error: %s", e)
+    except Exception as e:
+        logger.error("Unexpected error: %s", e)
 
 
 def main():
+    if uvloop is not None:
+        # Drive the IoT handler (MQTT client and plugins) with the libuv based loop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main_async())
 
 
-if __name__ == '__main__':
-    # Setup logging configuration
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+def setup_logging() -> QueueListener:
+    """
+    Configure root logging so records are only queued on the calling (event loop) thread
+    and formatted and written to stderr by a background listener thread.
+
+    Returns the started listener; stop it on exit to flush the remaining records.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     )
+    # Not basicConfig: it would give the QueueHandler a formatter and format every record twice
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
 
-    main()
+
+if __name__ == '__main__':
+    # Setup logging configuration
+    log_listener = setup_logging()
+    try:
+        main()
+    finally:
+        log_listener.stop()